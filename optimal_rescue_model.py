@@ -35,7 +35,8 @@ class OptimalRescueModel:
             results = sim.update(actions)
     """
 
-    def __init__(self, k_capacity: Dict[str, int] = None, use_lp: bool = False, fire_priority_weight: float = 0.0):
+    def __init__(self, k_capacity: Dict[str, int] = None, use_lp: bool = False, fire_priority_weight: float = 0.0,
+                 verbose: bool = True):
         """
         Initialize optimal rescue model.
 
@@ -47,25 +48,32 @@ class OptimalRescueModel:
             fire_priority_weight: Weight for fire proximity in item value calculation
                                  Higher values prioritize rescuing people closer to fire
                                  0.0 = disabled (default)
+            verbose: If False, suppress all progress logging from the model and
+                    its components (use this instead of redirecting stdout in
+                    batch runs)
         """
         self.phase = 'exploration'
         self.use_lp = use_lp
         self.phase_switched = False
         self.fire_priority_weight = fire_priority_weight
+        self.verbose = verbose
 
         # Replanning tracking
         self.replan_count = 0
         self.last_edge_count = None  # Track edge count to detect burns
+        self.last_graph_version = None  # graph['version'] last counted (renewed when the graph changes)
 
         # Initialize components
-        self.optimizer = RescueOptimizer(k_capacity, fire_priority_weight=fire_priority_weight)
-        self.coordinator = TacticalCoordinator()
+        self.optimizer = RescueOptimizer(k_capacity, fire_priority_weight=fire_priority_weight,
+                                         verbose=verbose)
+        self.coordinator = TacticalCoordinator(verbose=verbose)
 
         # Sweep coordinator (initialized on first call with num_firefighters)
         self.sweep_coordinator = None
         self.sweep_initialized = False
 
-        print(f"OptimalRescueModel initialized (use_lp={use_lp}, fire_weight={fire_priority_weight})")
+        if self.verbose:
+            print(f"OptimalRescueModel initialized (use_lp={use_lp}, fire_weight={fire_priority_weight})")
 
     def get_actions(self, state: Dict) -> Dict[str, List[Dict]]:
         """
@@ -79,8 +87,9 @@ class OptimalRescueModel:
         Returns:
             {firefighter_id: [action1, action2]}
         """
-        # Check if should switch to optimal rescue phase
-        if self._should_switch_phase(state) and not self.phase_switched:
+        # Check if should switch to optimal rescue phase (the check walks the
+        # sweep state, so skip it entirely once the switch has happened)
+        if not self.phase_switched and self._should_switch_phase(state):
             self._switch_to_optimal_rescue(state)
 
         # Check for graph changes (burned edges) in optimal rescue phase
@@ -93,10 +102,11 @@ class OptimalRescueModel:
             # Initialize sweep coordinator on first call
             if not self.sweep_initialized:
                 num_firefighters = len(state['firefighters'])
-                self.sweep_coordinator = SweepCoordinator(num_firefighters)
+                self.sweep_coordinator = SweepCoordinator(num_firefighters, verbose=self.verbose)
                 self.sweep_coordinator.initialize_sweep(state)
                 self.sweep_initialized = True
-                print(f"Sweep coordinator initialized with {num_firefighters} firefighters")
+                if self.verbose:
+                    print(f"Sweep coordinator initialized with {num_firefighters} firefighters")
 
             # Use sweep coordinator for systematic exploration
             return self.sweep_coordinator.get_sweep_actions(state)
@@ -117,10 +127,16 @@ class OptimalRescueModel:
         Returns:
             True if should switch phases
         """
+        # Check 2 (cheap, from the simulator's running totals)
+        all_capable_instructed = state['discovered_totals']['capable'] == 0
+
         # Check 1: All rooms visited
-        # If sweep coordinator is active, use its completion status
+        # If sweep coordinator is active, use its completion status (always
+        # asked, since it also tracks sweep stalls tick by tick)
         if self.sweep_coordinator and self.sweep_initialized:
             all_rooms_visited = self.sweep_coordinator.is_sweep_complete(state)
+        elif not all_capable_instructed:
+            return False  # No need to gather visited rooms
         else:
             # Fallback to firefighter visited_vertices
             graph = state['graph']
@@ -129,19 +145,12 @@ class OptimalRescueModel:
                 if v_data['type'] == 'room'
             ]
 
-            visited_rooms = set()
-            for ff_state in state['firefighters'].values():
-                visited_rooms.update(ff_state['visited_vertices'])
+            visited_rooms = set().union(
+                *(ff_state['visited_vertices'] for ff_state in state['firefighters'].values())
+            )
 
             all_rooms_visited = all(room in visited_rooms for room in all_rooms)
 
-        # Check 2: All capable instructed
-        discovered = state['discovered_occupants']
-        all_capable_instructed = all(
-            occupants['capable'] == 0
-            for occupants in discovered.values()
-        )
-
         return all_rooms_visited and all_capable_instructed
 
     def _switch_to_optimal_rescue(self, state: Dict):
@@ -157,35 +166,39 @@ class OptimalRescueModel:
         Args:
             state: Full state from sim.read()
         """
-        print("\n" + "="*60)
-        print("PHASE TRANSITION: Switching to Optimal Rescue Mode")
-        print("="*60)
+        if self.verbose:
+            print("\n" + "="*60)
+            print("PHASE TRANSITION: Switching to Optimal Rescue Mode")
+            print("="*60)
 
         # Get remaining incapable occupants
-        discovered = state['discovered_occupants']
-        total_incapable = sum(
-            occ['incapable'] for occ in discovered.values()
-        )
-        print(f"Remaining incapable occupants: {total_incapable}")
+        total_incapable = state['discovered_totals']['incapable']
+        if self.verbose:
+            print(f"Remaining incapable occupants: {total_incapable}")
 
         if total_incapable == 0:
-            print("No incapable occupants remaining - staying in exploration mode")
+            if self.verbose:
+                print("No incapable occupants remaining - staying in exploration mode")
             return
 
         # Step 1: Preprocessing
-        print("\nStep 1: Preprocessing distances...")
+        if self.verbose:
+            print("\nStep 1: Preprocessing distances...")
         self.optimizer.preprocess_distances(state)
 
         # Step 2: Generate items
-        print("\nStep 2: Generating rescue items...")
+        if self.verbose:
+            print("\nStep 2: Generating rescue items...")
         items = self.optimizer.generate_items(state)
 
         if not items:
-            print("No valid items generated - staying in exploration mode")
+            if self.verbose:
+                print("No valid items generated - staying in exploration mode")
             return
 
         # Step 3: Assignment
-        print(f"\nStep 3: Assigning items ({'LP' if self.use_lp else 'Greedy'})...")
+        if self.verbose:
+            print(f"\nStep 3: Assigning items ({'LP' if self.use_lp else 'Greedy'})...")
 
         if self.use_lp:
             # Use LP solver (if implemented)
@@ -193,18 +206,21 @@ class OptimalRescueModel:
                 from lp_rescue_optimizer import lp_optimal_assignment
                 assignments = lp_optimal_assignment(items, state)
             except ImportError:
-                print("Warning: LP solver not available, falling back to greedy")
+                if self.verbose:
+                    print("Warning: LP solver not available, falling back to greedy")
                 assignments = self.optimizer.greedy_assignment(items, state)
         else:
             # Use greedy algorithm
             assignments = self.optimizer.greedy_assignment(items, state)
 
         if not assignments:
-            print("No assignments generated - staying in exploration mode")
+            if self.verbose:
+                print("No assignments generated - staying in exploration mode")
             return
 
         # Step 4: Load into coordinator
-        print("\nStep 4: Loading assignments into tactical coordinator...")
+        if self.verbose:
+            print("\nStep 4: Loading assignments into tactical coordinator...")
 
         # Set optimizer reference for dynamic task claiming
         self.coordinator.optimizer = self.optimizer
@@ -219,39 +235,41 @@ class OptimalRescueModel:
         self.coordinator.assign_items(assignments, all_occupants)
 
         # Log detailed assignments
-        print("\n" + "="*60)
-        print("CHOSEN ITEM ASSIGNMENTS")
-        print("="*60)
-        for ff_id in sorted(assignments.keys()):
-            items = assignments[ff_id]
-            print(f"\n{ff_id}: {len(items)} items assigned")
-            total_time = 0
-            total_people = 0
-            for idx, item in enumerate(items):
-                people = sum(item['vector'].values())
-                total_people += people
-                total_time += item['time']
-
-                # Format vector nicely (only show rooms with count > 0)
-                vector_str = ', '.join([f"{room}:{count}" for room, count in item['vector'].items() if count > 0])
-
-                print(f"  {idx+1}. Rescue {people} from [{vector_str}]")
-                print(f"     Route: {item['entry_exit']} → {' → '.join(item['visit_sequence'])} → {item['drop_exit']}")
-                print(f"     Time: {item['time']:.1f}s, Value: {item['value']:.3f}")
-
-            print(f"  {ff_id} subtotal: {total_people} people, ~{total_time:.0f}s estimated")
-
-        # Calculate total
-        total_assigned = sum(sum(item['vector'].values()) for items in assignments.values() for item in items)
-        print(f"\nGrand total: {total_assigned}/{total_incapable} people assigned ({total_assigned/total_incapable*100:.1f}%)")
+        if self.verbose:
+            print("\n" + "="*60)
+            print("CHOSEN ITEM ASSIGNMENTS")
+            print("="*60)
+            for ff_id in sorted(assignments.keys()):
+                items = assignments[ff_id]
+                print(f"\n{ff_id}: {len(items)} items assigned")
+                total_time = 0
+                total_people = 0
+                for idx, item in enumerate(items):
+                    people = sum(item['vector'].values())
+                    total_people += people
+                    total_time += item['time']
+
+                    # Format vector nicely (only show rooms with count > 0)
+                    vector_str = ', '.join([f"{room}:{count}" for room, count in item['vector'].items() if count > 0])
+
+                    print(f"  {idx+1}. Rescue {people} from [{vector_str}]")
+                    print(f"     Route: {item['entry_exit']} → {' → '.join(item['visit_sequence'])} → {item['drop_exit']}")
+                    print(f"     Time: {item['time']:.1f}s, Value: {item['value']:.3f}")
+
+                print(f"  {ff_id} subtotal: {total_people} people, ~{total_time:.0f}s estimated")
+
+            # Calculate total
+            total_assigned = sum(sum(item['vector'].values()) for items in assignments.values() for item in items)
+            print(f"\nGrand total: {total_assigned}/{total_incapable} people assigned ({total_assigned/total_incapable*100:.1f}%)")
 
         # Transition complete
         self.phase = 'optimal_rescue'
         self.phase_switched = True
 
-        print("\n" + "="*60)
-        print("PHASE TRANSITION COMPLETE - Now in Optimal Rescue Mode")
-        print("="*60 + "\n")
+        if self.verbose:
+            print("\n" + "="*60)
+            print("PHASE TRANSITION COMPLETE - Now in Optimal Rescue Mode")
+            print("="*60 + "\n")
 
     def _exploration_actions(self, state: Dict) -> Dict[str, List[Dict]]:
         """
@@ -389,6 +407,11 @@ class OptimalRescueModel:
             True if graph changed (edges burned)
         """
         graph = state['graph']
+        version = graph.get('version')
+        if version is not None and version == self.last_graph_version:
+            return False  # Same graph version as last tick, so nothing burned
+        self.last_graph_version = version
+
         # Count only existing edges (not burned)
         current_edge_count = sum(1 for e in graph['edges'].values() if e.get('exists', True))
 
@@ -415,15 +438,17 @@ class OptimalRescueModel:
             state: Full state from sim.read()
         """
         self.replan_count += 1
-        print(f"\n⚠️  REPLANNING #{self.replan_count} - Graph changed (edges burned)")
+        if self.verbose:
+            print(f"\n⚠️  REPLANNING #{self.replan_count} - Graph changed (edges burned)")
 
         # Delegate replanning to coordinator
         affected_count = self.coordinator.handle_graph_change(state, self.optimizer)
 
-        if affected_count > 0:
-            print(f"   Replanning complete. Affected: {affected_count} people")
-        else:
-            print(f"   Replanning complete. No people affected")
+        if self.verbose:
+            if affected_count > 0:
+                print(f"   Replanning complete. Affected: {affected_count} people")
+            else:
+                print(f"   Replanning complete. No people affected")
 
     def get_status(self) -> str:
         """
@@ -31,7 +31,8 @@ class RescueOptimizer:
         self,
         k_capacity: Dict[str, int] = None,
         under_capacity_penalty: float = 0.1,
-        fire_priority_weight: float = 0.0
+        fire_priority_weight: float = 0.0,
+        verbose: bool = True
     ):
         """
         Initialize optimizer.
@@ -41,11 +42,13 @@ class RescueOptimizer:
                        If None, uses default k=3 for all firefighters
             under_capacity_penalty: Penalty multiplier per person under k (default 0.1)
             fire_priority_weight: Multiplier for fire proximity (0.0 = disabled, higher = stronger)
+            verbose: If False, skip progress logging (default True)
         """
         self.k_capacity = k_capacity or {}
         self.default_k = 3
         self.under_capacity_penalty = under_capacity_penalty
         self.fire_priority_weight = fire_priority_weight
+        self.verbose = verbose
         self.distance_matrix = {}
         self.room_priorities = {}
         self.fire_distances = {}  # {room_id: distance_to_fire_origin}
@@ -67,7 +70,8 @@ class RescueOptimizer:
         Args:
             state: Full state from sim.read()
         """
-        print("Preprocessing: Computing all-pairs shortest paths...")
+        if self.verbose:
+            print("Preprocessing: Computing all-pairs shortest paths...")
 
         graph = state['graph']
         discovered = state['discovered_occupants']
@@ -78,7 +82,8 @@ class RescueOptimizer:
             if occupants['incapable'] > 0
         ]
 
-        print(f"  Rooms with incapable: {len(rooms_with_incapable)} (skipping empty rooms)")
+        if self.verbose:
+            print(f"  Rooms with incapable: {len(rooms_with_incapable)} (skipping empty rooms)")
 
         # Compute distances only between non-empty rooms
         self.distance_matrix = {}
@@ -93,7 +98,8 @@ class RescueOptimizer:
             self.distance_matrix[exit_id] = pathfinding.dijkstra_single_source(graph, exit_id, carrying_penalty=1.0)
 
         # Add zero-cost teleportation between all exits (firefighters can start from any exit)
-        print("  Adding exit-to-exit teleportation (zero cost)...")
+        if self.verbose:
+            print("  Adding exit-to-exit teleportation (zero cost)...")
         for exit_a in exits:
             for exit_b in exits:
                 if exit_a != exit_b:
@@ -109,22 +115,26 @@ class RescueOptimizer:
 
         # Compute fire distances if fire priority weighting is enabled
         if self.fire_priority_weight > 0.0:
-            print("  Computing distances to fire origin...")
+            if self.verbose:
+                print("  Computing distances to fire origin...")
             fire_origin = state.get('fire_origin')
             if fire_origin:
                 # Run Dijkstra from fire origin to all rooms
-                fire_paths = pathfinding.dijkstra_single_source(graph, fire_origin, carrying_penalty=1.0)
+                fire_dists, _ = pathfinding.dijkstra_predecessors(graph, fire_origin, carrying_penalty=1.0)
                 self.fire_distances = {
                     room_id: dist
-                    for room_id, (dist, path) in fire_paths.items()
+                    for room_id, dist in fire_dists.items()
                     if room_id in rooms_with_incapable
                 }
-                print(f"    Fire distances computed for {len(self.fire_distances)} rooms")
+                if self.verbose:
+                    print(f"    Fire distances computed for {len(self.fire_distances)} rooms")
             else:
-                print("    WARNING: fire_priority_weight > 0 but no fire_origin found")
+                if self.verbose:
+                    print("    WARNING: fire_priority_weight > 0 but no fire_origin found")
                 self.fire_distances = {}
 
-        print(f"Preprocessing complete. Distance matrix computed ({len(self.distance_matrix)} vertices)")
+        if self.verbose:
+            print(f"Preprocessing complete. Distance matrix computed ({len(self.distance_matrix)} vertices)")
 
     def generate_items(self, state: Dict, k: int = None) -> List[Dict]:
         """
@@ -153,19 +163,22 @@ class RescueOptimizer:
         if k is None:
             k = self.default_k
 
-        print(f"Generating items with k={k}...")
+        if self.verbose:
+            print(f"Generating items with k={k}...")
 
         items = []
         rooms = pathfinding.get_rooms_with_incapable(state)
         exits = pathfinding.find_exits(state['graph'])
         discovered = state['discovered_occupants']
 
-        print(f"Rooms with incapable: {len(rooms)}")
-        print(f"Exits: {len(exits)}")
+        if self.verbose:
+            print(f"Rooms with incapable: {len(rooms)}")
+            print(f"Exits: {len(exits)}")
 
         # Generate items for r = 1, 2, 3, ..., k rooms
         for num_rooms in range(1, min(k + 1, len(rooms) + 1)):
-            print(f"  Generating {num_rooms}-room combinations...")
+            if self.verbose:
+                print(f"  Generating {num_rooms}-room combinations...")
 
             count_for_this_r = 0
 
@@ -218,14 +231,17 @@ class RescueOptimizer:
                         items.append(best_item)
                         count_for_this_r += 1
 
-            print(f"    Generated {count_for_this_r} items for {num_rooms}-room combos")
+            if self.verbose:
+                print(f"    Generated {count_for_this_r} items for {num_rooms}-room combos")
 
-        print(f"Total raw items: {len(items)}")
+        if self.verbose:
+            print(f"Total raw items: {len(items)}")
 
         # CRITICAL: Prune dominated items
         items = self.prune_dominated_items(items)
 
-        print(f"After pruning: {len(items)} items remain")
+        if self.verbose:
+            print(f"After pruning: {len(items)} items remain")
 
         self.items = items
         return items
@@ -312,7 +328,8 @@ class RescueOptimizer:
         Returns:
             List of non-dominated items
         """
-        print("Pruning dominated items...")
+        if self.verbose:
+            print("Pruning dominated items...")
 
         # Step 1: Build lookup of best single-room times
         single_times = {}  # {(room_id, count): best_time}
@@ -350,7 +367,8 @@ class RescueOptimizer:
                     # Dominated - remove it
                     removed_count += 1
 
-        print(f"  Removed {removed_count} dominated items")
+        if self.verbose:
+            print(f"  Removed {removed_count} dominated items")
 
         return pruned
 
@@ -375,7 +393,8 @@ class RescueOptimizer:
         Returns:
             {firefighter_id: [item1, item2, ...]}
         """
-        print("Running greedy assignment...")
+        if self.verbose:
+            print("Running greedy assignment...")
 
         # Sort by value density (high to low)
         sorted_items = sorted(items, key=lambda x: x['value'], reverse=True)
@@ -416,8 +435,9 @@ class RescueOptimizer:
             for room, count in item['vector'].items():
                 remaining[room] -= count
 
-        print(f"  Selected {selected_count} items")
-        print(f"  Assignments: {[len(assignments[fid]) for fid in sorted(assignments.keys())]}")
+        if self.verbose:
+            print(f"  Selected {selected_count} items")
+            print(f"  Assignments: {[len(assignments[fid]) for fid in sorted(assignments.keys())]}")
 
         # Remove firefighters with no assignments
         assignments = {fid: items for fid, items in assignments.items() if items}
@@ -4,20 +4,195 @@ Pathfinding and routing algorithms for optimal rescue.
 
 Provides:
 - Dijkstra's algorithm for all-pairs shortest paths
+- Distance + predecessor maps with on-demand path reconstruction
 - Item detail computation (complete paths with E² exit optimization)
 - BFS for single-destination pathfinding
+
+Traversals run over an integer CSR adjacency that is built once per
+graph version (see graph_version) and shared between queries.
 """
 
 import heapq
-from typing import Dict, List, Tuple, Optional
+from collections import OrderedDict, deque
+from typing import Dict, Hashable, List, NamedTuple, Tuple, Optional
 from itertools import permutations
 
 
+# Single-source results keyed by (graph_version, start, options).
+# The graph only changes when an edge burns, so most queries between
+# burns are repeats (sweep replanning, optimizer preprocessing, ...).
+_DIJKSTRA_CACHE_SIZE = 256
+_dijkstra_cache: OrderedDict = OrderedDict()
+
+# Shortest-path trees (distance + predecessor arrays) under the same keys;
+# distance-only callers never materialize the path lists
+_tree_cache: OrderedDict = OrderedDict()
+
+
+# Integer CSR adjacency per traversable graph (see _csr_adjacency)
+_CSR_CACHE_SIZE = 8
+_csr_cache: OrderedDict = OrderedDict()
+
+
+# BFS first-hop table per (graph_version, source), see bfs_next_step
+_BFS_TREE_CACHE_SIZE = 256
+_bfs_tree_cache: OrderedDict = OrderedDict()
+
+
+
+class CSRGraph(NamedTuple):
+    """
+    Compressed sparse row adjacency over integer vertex indices.
+
+    Neighbors of vertex i are indices[indptr[i]:indptr[i + 1]], reached
+    through edge_ids[k] for the same slice positions, in the order the
+    edges appear in graph['edges'].
+    """
+    vertex_ids: List[str]  # index -> vertex ID
+    index: Dict[str, int]  # vertex ID -> index
+    indptr: List[int]
+    indices: List[int]
+    edge_ids: List[str]
+    rank: List[int]  # Lexical order of vertex IDs (heap tie-break)
+
+
+def graph_version(graph: Dict, only_existing_edges: bool = True) -> Hashable:
+    """
+    Hashable key for the traversable graph.
+
+    Two graphs with the same key yield identical traversals, so it can key
+    caches across ticks. Graphs from sim.read() carry a 'version' that the
+    simulator renews whenever an edge or room is lost, which makes this an
+    O(1) lookup. Other graphs are fingerprinted from their vertex IDs and
+    edges on every call, so editing a hand-built graph in place is always
+    picked up. The vertex IDs matter: the CSR index (and so every cached
+    traversal) covers graph['vertices'], isolated vertices included.
+
+    Args:
+        graph: State graph from sim.read()
+        only_existing_edges: If True, leave burned edges out of the fingerprint
+
+    Returns:
+        graph['version'] if present, else (vertex IDs in graph order,
+        frozenset of (edge_id, vertex_a, vertex_b) tuples)
+    """
+    version = graph.get('version')
+    if version is not None:
+        return version
+
+    return tuple(graph['vertices']), frozenset(
+        (edge_id, edge_data['vertex_a'], edge_data['vertex_b'])
+        for edge_id, edge_data in graph['edges'].items()
+        if not only_existing_edges or edge_data['exists']
+    )
+
+
+def _csr_adjacency(graph: Dict, only_existing_edges: bool = True) -> CSRGraph:
+    """
+    Build (or fetch) the integer CSR adjacency for graph.
+
+    Built once per graph_version() and shared by all traversals, so
+    per-query work is integer indexing instead of rebuilding dict
+    adjacency from the edge dicts.
+
+    Args:
+        graph: State graph from sim.read()
+        only_existing_edges: If True, skip burned edges
+
+    Returns:
+        CSRGraph for the traversable edges
+    """
+    key = (graph_version(graph, only_existing_edges), only_existing_edges)
+
+    csr = _csr_cache.get(key)
+    if csr is not None:
+        _csr_cache.move_to_end(key)
+        return csr
+
+    vertex_ids = list(graph['vertices'])
+    index = {v_id: i for i, v_id in enumerate(vertex_ids)}
+
+    # Directed half-edges in the same order the dict-based builders used
+    half_edges = []
+    degree = [0] * len(vertex_ids)
+    for edge_id, edge_data in graph['edges'].items():
+        if only_existing_edges and not edge_data['exists']:
+            continue
+
+        a = index[edge_data['vertex_a']]
+        b = index[edge_data['vertex_b']]
+        half_edges.append((a, b, edge_id))
+        half_edges.append((b, a, edge_id))
+        degree[a] += 1
+        degree[b] += 1
+
+    indptr = [0] * (len(vertex_ids) + 1)
+    for i, d in enumerate(degree):
+        indptr[i + 1] = indptr[i] + d
+
+    fill = indptr[:-1]
+    indices = [0] * len(half_edges)
+    edge_ids = [None] * len(half_edges)
+    for a, b, edge_id in half_edges:
+        k = fill[a]
+        indices[k] = b
+        edge_ids[k] = edge_id
+        fill[a] = k + 1
+
+    rank = [0] * len(vertex_ids)
+    for r, i in enumerate(sorted(range(len(vertex_ids)), key=vertex_ids.__getitem__)):
+        rank[i] = r
+
+    csr = CSRGraph(vertex_ids, index, indptr, indices, edge_ids, rank)
+    _csr_cache[key] = csr
+    if len(_csr_cache) > _CSR_CACHE_SIZE:
+        _csr_cache.popitem(last=False)
+    return csr
+
+
 def dijkstra_single_source(
     graph: Dict,
     start: str,
     only_existing_edges: bool = True,
     carrying_penalty: float = 1.0
+) -> Dict[str, Tuple[float, List[str]]]:
+    """
+    Dijkstra's algorithm from single source to all vertices (memoized).
+
+    Results are cached per graph_version(), so repeated queries from the
+    same source on an unchanged graph are dictionary lookups. A fresh
+    top-level dict is returned each call; the path lists are shared and
+    must not be mutated.
+
+    Args:
+        graph: State graph from sim.read()
+        start: Starting vertex ID
+        only_existing_edges: If True, skip burned edges
+        carrying_penalty: Multiplier for movement cost (1.0 unloaded, 2.0 carrying)
+
+    Returns:
+        {vertex_id: (distance, path)}
+        where path = [start, ..., vertex_id]
+    """
+    key = (graph_version(graph, only_existing_edges), start, only_existing_edges, carrying_penalty)
+
+    result = _dijkstra_cache.get(key)
+    if result is None:
+        result = _dijkstra_single_source(graph, start, only_existing_edges, carrying_penalty)
+        _dijkstra_cache[key] = result
+        if len(_dijkstra_cache) > _DIJKSTRA_CACHE_SIZE:
+            _dijkstra_cache.popitem(last=False)  # Evict least recently used
+    else:
+        _dijkstra_cache.move_to_end(key)
+
+    return dict(result)
+
+
+def _dijkstra_single_source(
+    graph: Dict,
+    start: str,
+    only_existing_edges: bool = True,
+    carrying_penalty: float = 1.0
 ) -> Dict[str, Tuple[float, List[str]]]:
     """
     Dijkstra's algorithm from single source to all vertices.
@@ -37,85 +212,249 @@ def dijkstra_single_source(
 
     IMPORTANT: distance[start][start] = 0 (can rescue multiple from same room)
     """
-    vertices = graph['vertices']
-    edges = graph['edges']
+    tree = _shortest_path_tree(graph, start, only_existing_edges, carrying_penalty)
+    if tree is None:
+        return {}
+    vertex_ids, distances, predecessors = tree
 
-    # Build adjacency list with edge weights only (node weights added during traversal)
-    adjacency = {}
-    for v_id in vertices:
-        adjacency[v_id] = []
+    inf = float('inf')
 
-    for edge_id, edge_data in edges.items():
-        if only_existing_edges and not edge_data['exists']:
-            continue  # Skip burned edges
+    # Reconstruct paths
+    result = {}
+    for i, v_id in enumerate(vertex_ids):
+        if distances[i] == inf:
+            continue  # Unreachable
+
+        # Build path by following predecessors
+        path = []
+        current = i
+        while current != -1:
+            path.append(vertex_ids[current])
+            current = predecessors[current]
+
+        path.reverse()
+        result[v_id] = (distances[i], path)
+
+    return result
+
+
+def dijkstra_predecessors(
+    graph: Dict,
+    start: str,
+    only_existing_edges: bool = True,
+    carrying_penalty: float = 1.0
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """
+    Dijkstra distances plus predecessor map, without building path lists.
+
+    Same search (and cache) as dijkstra_single_source, in O(V) memory
+    instead of O(V x path length). Use reconstruct_path() for the few
+    paths that are actually needed.
+
+    Args:
+        graph: State graph from sim.read()
+        start: Starting vertex ID
+        only_existing_edges: If True, skip burned edges
+        carrying_penalty: Multiplier for movement cost (1.0 unloaded, 2.0 carrying)
+
+    Returns:
+        ({vertex_id: distance}, {vertex_id: predecessor_id}) over reachable
+        vertices; the predecessor of start is None
+    """
+    tree = _shortest_path_tree(graph, start, only_existing_edges, carrying_penalty)
+    if tree is None:
+        return {}, {}
+    vertex_ids, distances, predecessors = tree
+
+    inf = float('inf')
+    dist_map = {}
+    pred_map = {}
+    for i, v_id in enumerate(vertex_ids):
+        if distances[i] == inf:
+            continue  # Unreachable
+        dist_map[v_id] = distances[i]
+        pred = predecessors[i]
+        pred_map[v_id] = vertex_ids[pred] if pred != -1 else None
+
+    return dist_map, pred_map
+
+
+def reconstruct_path(predecessors: Dict[str, Optional[str]], target: str) -> List[str]:
+    """
+    Rebuild the path [start, ..., target] from dijkstra_predecessors() output.
 
-        va = edge_data['vertex_a']
-        vb = edge_data['vertex_b']
-        edge_weight = 1.0  # Each edge has unit weight (1 meter)
+    Args:
+        predecessors: Predecessor map from dijkstra_predecessors()
+        target: Destination vertex ID
+
+    Returns:
+        List of vertex IDs, or [] if target is unreachable
+    """
+    if target not in predecessors:
+        return []
+
+    path = []
+    current = target
+    while current is not None:
+        path.append(current)
+        current = predecessors[current]
 
-        adjacency[va].append((vb, edge_weight))
-        adjacency[vb].append((va, edge_weight))
+    path.reverse()
+    return path
 
-    # Dijkstra's algorithm with heap
-    distances = {v_id: float('inf') for v_id in vertices}
-    distances[start] = 0.0
 
-    predecessors = {v_id: None for v_id in vertices}
+def _shortest_path_tree(
+    graph: Dict,
+    start: str,
+    only_existing_edges: bool = True,
+    carrying_penalty: float = 1.0
+) -> Optional[Tuple[List[str], List[float], List[int]]]:
+    """
+    Shortest-path tree from start over integer indices (memoized).
 
-    # Priority queue: (distance, vertex_id)
-    pq = [(0.0, start)]
-    visited = set()
+    Args:
+        graph: State graph from sim.read()
+        start: Starting vertex ID
+        only_existing_edges: If True, skip burned edges
+        carrying_penalty: Multiplier for movement cost
+
+    Returns:
+        (vertex_ids, distances, predecessors), or None if start is unknown
+    """
+    key = (graph_version(graph, only_existing_edges), start, only_existing_edges, carrying_penalty)
+
+    tree = _tree_cache.get(key)
+    if tree is not None:
+        _tree_cache.move_to_end(key)
+        return tree
+
+    csr = _csr_adjacency(graph, only_existing_edges)
+    source = csr.index.get(start)
+    if source is None:
+        return None
+
+    # Node weight for current: all vertices have zero weight
+    # Only edges have weight (1 meter each)
+    current_node_weight = 0.0
+    edge_weight = 1.0
+
+    # Total movement cost: exit current + edge (entering target is free)
+    movement_cost = (current_node_weight + edge_weight) * carrying_penalty
+
+    # Every edge costs movement_cost, so a level-ordered search suffices;
+    # the heap is kept for the degenerate zero/negative-cost case
+    if movement_cost > 0.0:
+        distances, predecessors = _uniform_cost_tree(csr, source, movement_cost)
+    else:
+        distances, predecessors = _heap_dijkstra_tree(csr, source, movement_cost)
+
+    tree = (csr.vertex_ids, distances, predecessors)
+    _tree_cache[key] = tree
+    if len(_tree_cache) > _DIJKSTRA_CACHE_SIZE:
+        _tree_cache.popitem(last=False)
+    return tree
+
+
+def _uniform_cost_tree(
+    csr: CSRGraph,
+    source: int,
+    movement_cost: float
+) -> Tuple[List[float], List[int]]:
+    """
+    Shortest-path tree when every edge costs the same positive amount.
+
+    Every edge has the same weight, so Dijkstra settles vertices level by
+    level. This expands whole BFS levels (bucket queue) in O(V + E) plus a
+    sort of each frontier by lexical rank. That sort gives the exact pop
+    order of the heap version, so predecessors, ties and the accumulated
+    float distances are identical.
+
+    Args:
+        csr: _csr_adjacency(graph)
+        source: Index of the starting vertex
+        movement_cost: Cost of one edge (> 0)
+
+    Returns:
+        (distances, predecessors) indexed by vertex, inf / -1 if unreachable
+    """
+    indptr = csr.indptr
+    indices = csr.indices
+    rank_of = csr.rank.__getitem__
+
+    inf = float('inf')
+    distances = [inf] * len(csr.vertex_ids)
+    distances[source] = 0.0
+    predecessors = [-1] * len(csr.vertex_ids)
+
+    frontier = [source]
+    while frontier:
+        frontier.sort(key=rank_of)
+        next_frontier = []
+        for current in frontier:
+            new_dist = distances[current] + movement_cost
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                if distances[neighbor] == inf:
+                    distances[neighbor] = new_dist
+                    predecessors[neighbor] = current
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return distances, predecessors
+
+
+def _heap_dijkstra_tree(
+    csr: CSRGraph,
+    source: int,
+    movement_cost: float
+) -> Tuple[List[float], List[int]]:
+    """
+    Shortest-path tree via binary-heap Dijkstra (general fallback).
+
+    Args:
+        csr: _csr_adjacency(graph)
+        source: Index of the starting vertex
+        movement_cost: Cost of one edge
+
+    Returns:
+        (distances, predecessors) indexed by vertex, inf / -1 if unreachable
+    """
+    indptr = csr.indptr
+    indices = csr.indices
+    rank = csr.rank
+
+    # Dijkstra's algorithm with heap over integer vertex indices
+    inf = float('inf')
+    distances = [inf] * len(csr.vertex_ids)
+    distances[source] = 0.0
+    predecessors = [-1] * len(csr.vertex_ids)
+    visited = [False] * len(csr.vertex_ids)
+
+    # Priority queue: (distance, lexical rank of vertex ID, index)
+    pq = [(0.0, rank[source], source)]
 
     while pq:
-        current_dist, current = heapq.heappop(pq)
+        current_dist, _, current = heapq.heappop(pq)
 
-        if current in visited:
+        if visited[current]:
             continue
 
-        visited.add(current)
+        visited[current] = True
 
         # Explore neighbors
-        for neighbor, edge_weight in adjacency.get(current, []):
-            if neighbor in visited:
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            if visited[neighbor]:
                 continue
 
-            # Calculate total cost to move from current to neighbor
-            # Cost = (node_weight_current + edge_weight) * carrying_penalty
-            # We charge for: traversing FROM current to edge + edge traversal
-            # Entering target vertex is free (you're at the door immediately)
-
-            # Node weight for current: all vertices have zero weight
-            # Only edges have weight (1 meter each)
-            current_node_weight = 0.0
-
-            # Total movement cost: exit current + edge (entering target is free)
-            movement_cost = (current_node_weight + edge_weight) * carrying_penalty
-
-            # New distance to neighbor
             new_dist = current_dist + movement_cost
 
             if new_dist < distances[neighbor]:
                 distances[neighbor] = new_dist
                 predecessors[neighbor] = current
-                heapq.heappush(pq, (new_dist, neighbor))
+                heapq.heappush(pq, (new_dist, rank[neighbor], neighbor))
 
-    # Reconstruct paths
-    result = {}
-    for v_id in vertices:
-        if distances[v_id] == float('inf'):
-            continue  # Unreachable
-
-        # Build path by following predecessors
-        path = []
-        current = v_id
-        while current is not None:
-            path.append(current)
-            current = predecessors[current]
-
-        path.reverse()
-        result[v_id] = (distances[v_id], path)
-
-    return result
+    return distances, predecessors
 
 
 def dijkstra_all_pairs(
@@ -180,59 +519,67 @@ def bfs_next_step(
     if current == goal:
         return None  # Already at goal
 
-    # BFS to find path
-    vertices = graph['vertices']
-    edges = graph['edges']
+    csr = _csr_adjacency(graph)
+    source = csr.index.get(current)
+    target = csr.index.get(goal)
+    if source is None or target is None:
+        return None  # Unknown vertex
 
-    # Build adjacency
-    adjacency = {}
-    for v_id in vertices:
-        adjacency[v_id] = []
+    first_hops = _bfs_first_hops(graph, csr, source)
+    step = first_hops[target]
+    if step == -1:
+        return None  # Unreachable
 
-    for edge_data in edges.values():
-        if not edge_data['exists']:
-            continue  # Skip burned
+    return csr.vertex_ids[step]  # Next step after current
 
-        va = edge_data['vertex_a']
-        vb = edge_data['vertex_b']
-        adjacency[va].append(vb)
-        adjacency[vb].append(va)
 
-    # BFS
-    queue = [current]
-    visited = {current}
-    predecessors = {current: None}
+def _bfs_first_hops(graph: Dict, csr: CSRGraph, source: int) -> List[int]:
+    """
+    First hop from source toward every vertex along the BFS tree (memoized).
 
-    found = False
-    while queue:
-        node = queue.pop(0)
+    One full BFS answers bfs_next_step for every goal from the same source
+    until the graph changes. The tree matches the early-exit search it
+    replaces: a vertex's predecessor is fixed when it is first discovered.
 
-        if node == goal:
-            found = True
-            break
+    Args:
+        graph: State graph from sim.read()
+        csr: _csr_adjacency(graph)
+        source: Index of the starting vertex
 
-        for neighbor in adjacency.get(node, []):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                predecessors[neighbor] = node
-                queue.append(neighbor)
+    Returns:
+        List of vertex indices (-1 for the source and unreachable vertices)
+    """
+    key = (graph_version(graph), source)
 
-    if not found:
-        return None  # Unreachable
+    first_hops = _bfs_tree_cache.get(key)
+    if first_hops is not None:
+        _bfs_tree_cache.move_to_end(key)
+        return first_hops
 
-    # Backtrack to find next step from current
-    path = []
-    node = goal
-    while node is not None:
-        path.append(node)
-        node = predecessors[node]
+    indptr = csr.indptr
+    indices = csr.indices
 
-    path.reverse()  # [current, ..., goal]
+    # BFS, carrying each vertex's first hop down the tree
+    queue = deque([source])
+    first_hops = [-1] * len(csr.vertex_ids)
+    seen = [False] * len(csr.vertex_ids)
+    seen[source] = True
 
-    if len(path) < 2:
-        return None
+    while queue:
+        node = queue.popleft()
+        hop = first_hops[node]
+
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            if not seen[neighbor]:
+                seen[neighbor] = True
+                first_hops[neighbor] = neighbor if node == source else hop
+                queue.append(neighbor)
 
-    return path[1]  # Next step after current
+    _bfs_tree_cache[key] = first_hops
+    if len(_bfs_tree_cache) > _BFS_TREE_CACHE_SIZE:
+        _bfs_tree_cache.popitem(last=False)
+    return first_hops
 
 
 def compute_optimal_item_for_vector(
@@ -410,40 +757,34 @@ def bfs_path_with_edges(
         - path: List of vertex IDs from start to goal, or None if unreachable
         - edge_ids: Set of edge IDs used in the path
     """
-    vertices = graph['vertices']
-    edges = graph['edges']
-
-    # Build adjacency with edge tracking
-    adjacency = {}  # {vertex_id: [(neighbor, edge_id), ...]}
-    for v_id in vertices:
-        adjacency[v_id] = []
-
-    for edge_id, edge_data in edges.items():
-        if not edge_data['exists']:
-            continue  # Skip burned edges
+    csr = _csr_adjacency(graph)
+    source = csr.index.get(start)
+    target = csr.index.get(goal)
+    if source is None or target is None:
+        return None, set()
 
-        va = edge_data['vertex_a']
-        vb = edge_data['vertex_b']
-        adjacency[va].append((vb, edge_id))
-        adjacency[vb].append((va, edge_id))
+    indptr = csr.indptr
+    indices = csr.indices
 
     # BFS
-    queue = [start]
-    visited = {start}
-    predecessors = {start: (None, None)}  # {vertex: (prev_vertex, edge_id)}
+    queue = deque([source])
+    predecessors = [-1] * len(csr.vertex_ids)
+    predecessors[source] = source
+    via_edge = [None] * len(csr.vertex_ids)  # Edge ID each vertex was reached through
 
     found = False
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
 
-        if node == goal:
+        if node == target:
             found = True
             break
 
-        for neighbor, edge_id in adjacency.get(node, []):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                predecessors[neighbor] = (node, edge_id)
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            if predecessors[neighbor] == -1:
+                predecessors[neighbor] = node
+                via_edge[neighbor] = csr.edge_ids[k]
                 queue.append(neighbor)
 
     if not found:
@@ -452,15 +793,14 @@ def bfs_path_with_edges(
     # Backtrack to build path and collect edge IDs
     path = []
     edge_ids = set()
-    current = goal
+    current = target
 
-    while current is not None:
-        path.append(current)
-        prev, edge_id = predecessors[current]
-        if edge_id is not None:
-            edge_ids.add(edge_id)
-        current = prev
+    while current != source:
+        path.append(csr.vertex_ids[current])
+        edge_ids.add(via_edge[current])
+        current = predecessors[current]
 
+    path.append(csr.vertex_ids[source])
     path.reverse()
     return path, edge_ids
 
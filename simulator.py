@@ -3,13 +3,86 @@ Emergency Evacuation Simulator
 A graph-based simulator for modeling building evacuations during emergencies.
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
+import bisect
+import itertools
+import json
+import os
+import pickle
 import random
 import math
+import sys
 
 
-@dataclass
+# Parsed building configs keyed by absolute path -> (mtime, config)
+_config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# dataclass(slots=True) needs Python 3.10; older interpreters fall back to
+# regular (dict-backed) instances with identical behavior
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Source of read()'s graph['version'] stamps; process-wide, so no two
+# graph dicts (from any Simulation) ever share a version
+_graph_versions = itertools.count()
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """
+    Load a building config JSON, parsing each file at most once per process.
+
+    The parsed dict is reused until the file's mtime changes, so scripts
+    that build many simulations from the same building skip the JSON
+    parse. Simulation never mutates its config; callers sharing the
+    result must not either.
+
+    Args:
+        path: Path to the config JSON file
+
+    Returns:
+        Config dict with 'vertices', 'edges', 'occupancy_probabilities'
+    """
+    key = os.path.abspath(path)
+    mtime = os.path.getmtime(key)
+
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(key, 'r') as f:
+        config = json.load(f)
+
+    _config_cache[key] = (mtime, config)
+    return config
+
+
+def _count_bernoulli(rng: random.Random, n: int, p: float) -> int:
+    """
+    Count successes in n Bernoulli(p) trials, one rng.random() draw each.
+
+    Consumes exactly the draws of a per-person `rng.random() < p` loop, so
+    seeded runs are unchanged. With p <= 0 nobody can die, so the n draws
+    are skipped in one call: random() reads two 32-bit words, and so does
+    every 64 bits of getrandbits().
+
+    Args:
+        rng: Random number generator
+        n: Number of trials
+        p: Success probability per trial
+
+    Returns:
+        Number of successes
+    """
+    if n <= 0:
+        return 0
+    if p <= 0.0:
+        rng.getrandbits(64 * n)  # Advance the stream by n random() calls
+        return 0
+    draw = rng.random
+    return sum([draw() < p for _ in range(n)])
+
+
+@dataclass(**_SLOTS)
 class Vertex:
     """Represents a node in the building graph (room, hallway, exit, etc.)"""
     id: str
@@ -43,9 +116,10 @@ class Vertex:
     @property
     def smoke_level(self) -> float:
         """Calculate smoke concentration as a fraction (0.0 to 1.0) for death calculations"""
-        if self.volume == 0:
+        volume = self.area * self.ceiling_height  # Inlined self.volume (hot: read per tick and per frame)
+        if volume == 0:
             return 0.0
-        return min(1.0, self.smoke_amount / self.volume)
+        return min(1.0, self.smoke_amount / volume)
 
     def apply_smoke_deaths(self, rng: random.Random, tick_duration: float = 1.0) -> Dict[str, int]:
         """
@@ -65,24 +139,15 @@ class Vertex:
         death_probability_per_second = self.smoke_level ** 3 * 0.02
         death_probability = death_probability_per_second * tick_duration
 
-        deaths = {'capable': 0, 'incapable': 0, 'instructed': 0}
+        deaths = {
+            'capable': _count_bernoulli(rng, self.capable_count, death_probability),
+            'incapable': _count_bernoulli(rng, self.incapable_count, death_probability),
+            'instructed': _count_bernoulli(rng, self.instructed_capable_count, death_probability)
+        }
 
-        # Apply deaths to capable (uninstructed)
-        for _ in range(self.capable_count):
-            if rng.random() < death_probability:
-                deaths['capable'] += 1
+        # Apply deaths to capable (uninstructed), incapable, instructed capable
         self.capable_count -= deaths['capable']
-
-        # Apply deaths to incapable
-        for _ in range(self.incapable_count):
-            if rng.random() < death_probability:
-                deaths['incapable'] += 1
         self.incapable_count -= deaths['incapable']
-
-        # Apply deaths to instructed capable
-        for _ in range(self.instructed_capable_count):
-            if rng.random() < death_probability:
-                deaths['instructed'] += 1
         self.instructed_capable_count -= deaths['instructed']
 
         return deaths
@@ -101,7 +166,7 @@ class Vertex:
         return deaths
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Edge:
     """Represents a corridor/connection between vertices"""
     id: str
@@ -145,7 +210,7 @@ class Edge:
         return self.base_burn_rate * time_factor * distance_factor * width_factor * tick_duration
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Firefighter:
     """Represents a firefighter/responder"""
     id: str
@@ -187,7 +252,8 @@ class Simulation:
         config: Dict[str, Any],
         num_firefighters: int,
         fire_origin: str,
-        seed: int = 42
+        seed: int = 42,
+        verbose: bool = True
     ):
         """
         Initialize simulation from configuration.
@@ -197,10 +263,12 @@ class Simulation:
             num_firefighters: Number of firefighters to deploy
             fire_origin: Vertex ID where fire starts
             seed: Random seed for reproducibility
+            verbose: If False, skip per-tick progress logging (default True)
         """
         self.rng = random.Random(seed)
+        self.verbose = verbose
         self.tick = 0
-        self.fire_origin = fire_origin
+        self.fire_origin = sys.intern(fire_origin)
         self.rescued_count = 0
         self.dead_count = 0
 
@@ -208,9 +276,42 @@ class Simulation:
         self.vertices: Dict[str, Vertex] = {}
         self.edges: Dict[str, Edge] = {}
         self.adjacency: Dict[str, List[Tuple[str, str]]] = {}  # vertex_id -> [(neighbor_id, edge_id), ...]
+        self.neighbor_edges: Dict[str, Dict[str, str]] = {}  # vertex_id -> {neighbor_id: edge_id} (first edge wins)
+
+        # Graph structure served by read(); rebuilt only after an edge is
+        # deleted or a room burns down (the rest of it is static)
+        self._graph_structure: Optional[Dict[str, Any]] = None
+        self._graph_dirty = True
+
+        # Connected components of the existing-edge graph (see
+        # _component_labels); rebuilt lazily after an edge is deleted
+        self._components: Optional[Dict[str, str]] = None
+        self._exit_components: Set[str] = set()  # Labels of components holding an exit
+
+        # Per-firefighter visited_vertices lists served by read(), keyed by
+        # the set object and its size (the set only grows until replaced)
+        self._visited_lists: Dict[str, Tuple[set, int, List[str]]] = {}
 
         self._build_graph(config)
+
+        # Room IDs in vertex order (vertex types never change)
+        self.room_ids: List[str] = [
+            v_id for v_id, v in self.vertices.items() if v.type == 'room'
+        ]
+        self.room_id_set: frozenset = frozenset(self.room_ids)
+
+        self._build_spatial_tables()
+        self._build_smoke_tables()
+        self._build_fire_tables()
         self._initialize_occupants(config.get('occupancy_probabilities', {}))
+
+        # Occupants are conserved: every one still in the building (in a
+        # vertex or carried) is either later rescued or dead, so the total
+        # fixes the remaining count without rescanning vertices
+        self.total_initial_occupants = sum(
+            v.capable_count + v.incapable_count + v.instructed_capable_count
+            for v in self.vertices.values()
+        )
         self._calculate_distances_to_fire()
 
         # Initialize fire at origin
@@ -219,10 +320,17 @@ class Simulation:
 
         # Initialize firefighters at exits
         self.firefighters: Dict[str, Firefighter] = {}
+        self._ff_by_position: Dict[str, List[str]] = {}  # vertex_id -> [ff_ids] in creation order
+        self._ff_rank: Dict[str, int] = {}  # ff_id -> creation index (orders the lists above)
         self._initialize_firefighters(num_firefighters)
 
     def _build_graph(self, config: Dict[str, Any]):
-        """Build graph structure from configuration"""
+        """
+        Build graph structure from configuration.
+
+        Vertex and edge IDs are interned so every dict probe on them
+        (adjacency, positions, state keys) hits the identity fast path.
+        """
         # Create vertices
         for v_config in config.get('vertices', []):
             v_type = v_config.get('type', 'room')
@@ -235,7 +343,7 @@ class Simulation:
                 area = 0.0  # Zero node weight for non-rooms
 
             vertex = Vertex(
-                id=v_config['id'],
+                id=sys.intern(v_config['id']),
                 type=v_type,
                 room_type=v_config.get('room_type', 'none'),
                 capacity=v_config.get('capacity', 100),
@@ -247,13 +355,14 @@ class Simulation:
             )
             self.vertices[vertex.id] = vertex
             self.adjacency[vertex.id] = []
+            self.neighbor_edges[vertex.id] = {}
 
         # Create edges (all unit length by definition)
         for e_config in config.get('edges', []):
             edge = Edge(
-                id=e_config['id'],
-                vertex_a=e_config['vertex_a'],
-                vertex_b=e_config['vertex_b'],
+                id=sys.intern(e_config['id']),
+                vertex_a=sys.intern(e_config['vertex_a']),
+                vertex_b=sys.intern(e_config['vertex_b']),
                 max_flow=e_config.get('max_flow', 5),
                 base_burn_rate=e_config.get('base_burn_rate', 0.0001),
                 width=e_config.get('width', 2.0)  # Default 2m width
@@ -263,6 +372,8 @@ class Simulation:
             # Build adjacency list (undirected graph)
             self.adjacency[edge.vertex_a].append((edge.vertex_b, edge.id))
             self.adjacency[edge.vertex_b].append((edge.vertex_a, edge.id))
+            self.neighbor_edges[edge.vertex_a].setdefault(edge.vertex_b, edge.id)
+            self.neighbor_edges[edge.vertex_b].setdefault(edge.vertex_a, edge.id)
 
     def _initialize_occupants(self, occupancy_probs: Dict[str, Any]):
         """
@@ -326,60 +437,181 @@ class Simulation:
                     vertex.incapable_count = max(0, int(self.rng.gauss(expected_incapable, math.sqrt(expected_incapable))))
                     vertex.incapable_count = min(vertex.incapable_count, remaining_capacity)
 
-    def _calculate_distances_to_fire(self):
+    def _build_spatial_tables(self):
         """
-        Calculate spatial distances from ALL burning vertices to all edges.
-        Uses Euclidean distance for performance (fast O(1) calculation per edge).
-        This is called dynamically as fire spreads.
+        Precompute static geometry used by _calculate_distances_to_fire.
+
+        Vertex positions and edge midpoints never change, so they are
+        resolved once instead of through visual_position dicts every tick:
+        - _vertex_points: {vertex_id: (x, y, floor)} for vertices with x/y
+        - _edge_midpoints: [(edge, x, y, floor)] for edges with both ends placed
+        - _unplaced_edges: edges lacking position data (distance stays inf)
+
+        Also resets the fire-distance state: every edge starts at infinity
+        and _fire_sources (vertices already folded in) starts empty.
         """
-        # Find all burning vertices (fire_intensity > 0 or is_burned)
-        burning_vertices = [
-            v_id for v_id, v in self.vertices.items()
-            if v.fire_intensity > 0 or v.is_burned
-        ]
+        self._fire_sources = set()
 
-        if not burning_vertices:
-            # No fire yet - use fire origin
-            if self.fire_origin in self.vertices:
-                burning_vertices = [self.fire_origin]
-            else:
-                return
+        self._vertex_points: Dict[str, Tuple[float, float, float]] = {}
+        for v_id, v in self.vertices.items():
+            if v.visual_position and 'x' in v.visual_position:
+                self._vertex_points[v_id] = (v.visual_position['x'], v.visual_position['y'], v.floor)
 
-        # For each edge, find minimum spatial distance to ANY burning vertex
+        self._edge_midpoints: List[Tuple[Edge, float, float, float]] = []
+        self._unplaced_edges: List[Edge] = []
         for edge in self.edges.values():
-            min_distance = float('inf')
-
-            # Get edge midpoint position (average of its two endpoints)
             v_a = self.vertices.get(edge.vertex_a)
             v_b = self.vertices.get(edge.vertex_b)
 
             if not v_a or not v_b or not v_a.visual_position or not v_b.visual_position:
-                # No position data - fallback to infinity
-                edge.distance_to_fire = float('inf')
+                self._unplaced_edges.append(edge)
                 continue
 
             # Check if positions have x/y keys
             if 'x' not in v_a.visual_position or 'x' not in v_b.visual_position:
-                edge.distance_to_fire = float('inf')
+                self._unplaced_edges.append(edge)
                 continue
 
             # Edge midpoint (2D position and floor)
             edge_x = (v_a.visual_position['x'] + v_b.visual_position['x']) / 2.0
             edge_y = (v_a.visual_position['y'] + v_b.visual_position['y']) / 2.0
             edge_floor = (v_a.floor + v_b.floor) / 2.0  # Average floor for edge midpoint
+            self._edge_midpoints.append((edge, edge_x, edge_y, edge_floor))
 
-            # Find closest burning vertex
-            for burning_v_id in burning_vertices:
-                burning_v = self.vertices[burning_v_id]
-                if not burning_v.visual_position or 'x' not in burning_v.visual_position:
-                    continue
+        for edge in self.edges.values():
+            edge.distance_to_fire = float('inf')
 
+    def _build_smoke_tables(self):
+        """
+        Precompute the static per-link factors used by _update_smoke.
+
+        Volumes, corridor widths and floors never change, so each vertex
+        gets (vertex, volume, links) with one link per adjacency entry:
+        (neighbor_index, diffusion_coefficient, vertical_modifier, min_volume).
+        """
+        index = {v_id: i for i, v_id in enumerate(self.vertices)}
+
+        self._smoke_table: List[Tuple[Vertex, float, List[Tuple[int, float, float, float]]]] = []
+        for vertex_id, vertex in self.vertices.items():
+            links = []
+            for neighbor_id, edge_id in self.adjacency[vertex_id]:
+                neighbor = self.vertices[neighbor_id]
+                edge = self.edges[edge_id]
+
+                # Diffusion rate scales with corridor width (wider = more flow)
+                # All edges have unit length, physical distance = UNIT_LENGTH
+                # Base diffusion coefficient: 0.45 (balanced for moderate spread)
+                width_factor = edge.width / 2.0  # Normalized to 2m reference
+                diffusion_coefficient = 0.45 * width_factor
+
+                # Vertical smoke spread modifier: smoke rises faster than it descends
+                vertical_modifier = 1.0
+                if neighbor.floor > vertex.floor:
+                    # Smoke flowing upward (neighbor is above current vertex) - faster
+                    vertical_modifier = 1.5
+                elif neighbor.floor < vertex.floor:
+                    # Smoke flowing downward (neighbor is below current vertex) - slower
+                    vertical_modifier = 0.5
+
+                links.append((index[neighbor_id], diffusion_coefficient, vertical_modifier,
+                              min(vertex.volume, neighbor.volume)))
+
+            self._smoke_table.append((vertex, vertex.volume, links))
+
+    def _build_fire_tables(self):
+        """
+        Resolve adjacency to object references for _update_fire_intensity.
+
+        Each vertex gets (vertex, links) with one link per adjacency entry:
+        (neighbor, edge, preheat_width_factor, preheat_distance_factor,
+        spread_width_factor, vertical_modifier), so the per-tick loop reads
+        attributes directly instead of hashing vertex and edge ID strings.
+        Corridor widths, vertex positions and floors never change, so these
+        factors are computed here once instead of per burning link per tick.
+        """
+        self._fire_table: List[Tuple[Vertex, List[Tuple[Vertex, Edge, float, float, float, float]]]] = []
+        for vertex_id, vertex in self.vertices.items():
+            links = []
+            for neighbor_id, edge_id in self.adjacency[vertex_id]:
+                neighbor = self.vertices[neighbor_id]
+                edge = self.edges[edge_id]
+
+                # Preheating: wider corridors = more heat/smoke transfer
+                preheat_width_factor = edge.width / 2.0  # Normalized to 2m reference
+
+                # Preheating: radiant heat decays with spatial distance
+                # Even if connected through hallway, farther rooms contribute less
+                spatial_distance = self._get_spatial_distance(vertex_id, neighbor_id)
+                if spatial_distance != float('inf'):
+                    # Inverse square law approximation for radiant heat
+                    # At 1 unit: 1.0× effect, at 2 units: 0.5× effect, at 3 units: 0.33× effect
+                    preheat_distance_factor = 1.0 / max(1.0, spatial_distance)
+                else:
+                    # No position data: use graph connectivity only
+                    preheat_distance_factor = 1.0
+
+                # Ignition: narrower corridors = faster spread (easier to fully ignite)
+                # All edges have unit length, physical distance = UNIT_LENGTH
+                spread_width_factor = 2.0 / max(0.5, edge.width)  # 2m reference
+
+                # Vertical fire spread modifier: fire spreads slower through floors
+                vertical_modifier = 1.0
+                if vertex.floor != neighbor.floor:
+                    # Fire spreading between floors (through staircases) - 30% slower
+                    vertical_modifier = 0.7
+
+                links.append((neighbor, edge, preheat_width_factor, preheat_distance_factor,
+                              spread_width_factor, vertical_modifier))
+
+            self._fire_table.append((vertex, links))
+
+    def _calculate_distances_to_fire(self):
+        """
+        Calculate spatial distances from ALL burning vertices to all edges.
+        Uses Euclidean distance for performance (fast O(1) calculation per edge).
+        This is called dynamically as fire spreads.
+
+        Fire intensity never drops back to zero, so the burning set only
+        grows: each call folds just the newly burning vertices into the
+        running per-edge minimum (O(E x new) instead of O(E x burning)).
+        """
+        # Find newly burning vertices (fire_intensity > 0 or is_burned)
+        fire_sources = self._fire_sources
+        burning_vertices = [
+            v_id for v_id, v in self.vertices.items()
+            if v_id not in fire_sources and (v.fire_intensity > 0 or v.is_burned)
+        ]
+
+        if not burning_vertices and not fire_sources:
+            # No fire yet - use fire origin
+            if self.fire_origin in self.vertices:
+                burning_vertices = [self.fire_origin]
+            else:
+                return
+
+        if not burning_vertices:
+            return  # Fire has not spread since the last call
+        fire_sources.update(burning_vertices)
+
+        # Positions of burning vertices that have coordinates
+        vertex_points = self._vertex_points
+        burning_points = [
+            vertex_points[v_id] for v_id in burning_vertices
+            if v_id in vertex_points
+        ]
+
+        # For each edge, find minimum spatial distance to ANY burning vertex
+        for edge, edge_x, edge_y, edge_floor in self._edge_midpoints:
+            min_distance = edge.distance_to_fire
+
+            # Find closest burning vertex
+            for burning_x, burning_y, burning_floor in burning_points:
                 # 3D Euclidean distance from edge midpoint to burning vertex
-                dx = edge_x - burning_v.visual_position['x']
-                dy = edge_y - burning_v.visual_position['y']
+                dx = edge_x - burning_x
+                dy = edge_y - burning_y
 
                 # Vertical distance (floor difference × floor height)
-                floor_diff = abs(edge_floor - burning_v.floor)
+                floor_diff = abs(edge_floor - burning_floor)
                 dz = floor_diff * 3.0  # 3 meters per floor
 
                 distance = (dx**2 + dy**2 + dz**2)**0.5
@@ -444,8 +676,52 @@ class Simulation:
             )
             ff.mark_visited(exit_position)
             self.firefighters[ff.id] = ff
+            self._ff_rank[ff.id] = i
+            self._ff_by_position.setdefault(exit_position, []).append(ff.id)
+
+    def mark_all_rooms_visited(self):
+        """
+        Reveal every room to every firefighter (perfect-information runs).
+
+        Merges the prebuilt room_id_set with a single C-level set update per
+        firefighter, instead of per-room adds.
+        """
+        for ff in self.firefighters.values():
+            ff.visited_vertices.update(self.room_id_set)
+
+    def snapshot(self) -> bytes:
+        """
+        Serialize the complete simulation state, including the RNG.
+
+        Restoring a snapshot is much cheaper than building a new Simulation
+        from its config, so take one at tick 0 and restore it for each rerun.
 
-    def update(self, actions: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        Returns:
+            Opaque bytes for Simulation.restore()
+        """
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def restore(cls, data: bytes) -> 'Simulation':
+        """
+        Rebuild an independent Simulation from snapshot() bytes.
+
+        Only restore snapshots you created yourself (this uses pickle).
+
+        Args:
+            data: Bytes returned by snapshot()
+
+        Returns:
+            Simulation in exactly the snapshotted state
+        """
+        sim = pickle.loads(data)
+        if not isinstance(sim, cls):
+            raise ValueError(f"Snapshot does not contain a {cls.__name__}")
+        # The pickled graph's version may come from another process
+        sim._graph_dirty = True
+        return sim
+
+    def update(self, actions: Dict[str, List[Dict[str, Any]]], skip_physics: bool = False) -> Dict[str, Any]:
         """
         Execute one simulation tick.
 
@@ -456,9 +732,14 @@ class Simulation:
                 - instruct: {'type': 'instruct'} - instruct all capable people at current vertex (1 pt)
                 - pick_up_incapable: {'type': 'pick_up_incapable'} - pick up 1 incapable person (1 pt)
                 - drop_off: {'type': 'drop_off'} - drop off carried person at current vertex (1 pt)
+            skip_physics: If True, only execute the firefighter actions: no
+                instructed movement, random events, fire, smoke or deaths, and
+                the tick counter does not advance (for scenario setup)
 
         Returns:
-            Dictionary with action results and events
+            Dictionary with action results and events; 'remaining' is the
+            number of occupants still to be rescued or lost after this tick,
+            so driver loops can stop on it without calling get_stats()
         """
         results = {
             'tick': self.tick,
@@ -468,6 +749,22 @@ class Simulation:
             'dead_this_tick': 0
         }
 
+        self._apply_actions(actions, results)
+
+        if not skip_physics:
+            self._advance_physics(results)
+
+        results['remaining'] = self.remaining_occupants
+        return results
+
+    def _apply_actions(self, actions: Dict[str, List[Dict[str, Any]]], results: Dict[str, Any]):
+        """
+        Accumulate movement points and execute firefighter actions.
+
+        Args:
+            actions: {firefighter_id: [action_dict, ...]}
+            results: Tick results dict to record action results into
+        """
         # Execute firefighter actions
         # First, accumulate movement points for all firefighters
         for ff in self.firefighters.values():
@@ -510,7 +807,7 @@ class Simulation:
                     ticks_needed = int((cost_preview - ff.movement_points_accumulated) / ff.movement_points_per_tick) + 1
                     ff_results.append({'action': action, 'success': False, 'reason': 'insufficient_accumulated_points'})
                     # Only log when waiting is significant (more than 2 ticks)
-                    if ticks_needed > 2:
+                    if self.verbose and ticks_needed > 2:
                         print(f"    {ff_id}: {action.get('type')} needs {cost_preview:.1f} points, "
                               f"has {ff.movement_points_accumulated:.1f}, waiting {ticks_needed} more ticks")
                     continue
@@ -535,6 +832,14 @@ class Simulation:
 
             results['action_results'][ff_id] = ff_results
 
+    def _advance_physics(self, results: Dict[str, Any]):
+        """
+        Advance the world by one tick after actions: instructed movement,
+        random events, fire, smoke and smoke deaths.
+
+        Args:
+            results: Tick results dict to record events and counts into
+        """
         # Move instructed capable people toward exits
         instructed_results = self._move_instructed_people()
         results['events'].extend(instructed_results['events'])
@@ -569,7 +874,54 @@ class Simulation:
                 })
 
         self.tick += 1
-        return results
+
+    def teleport_firefighter(self, ff_id: str, vertex_id: str):
+        """
+        Place a firefighter at any vertex without spending a tick (scenario setup).
+
+        Args:
+            ff_id: Firefighter ID
+            vertex_id: Destination vertex ID
+        """
+        if ff_id not in self.firefighters:
+            raise ValueError(f"Unknown firefighter: {ff_id}")
+        if vertex_id not in self.vertices:
+            raise ValueError(f"Unknown vertex: {vertex_id}")
+
+        ff = self.firefighters[ff_id]
+        self._set_position(ff, vertex_id)
+        ff.mark_visited(vertex_id)
+
+    def firefighters_at(self, vertex_id: str) -> List[str]:
+        """
+        IDs of firefighters currently at vertex_id, in creation order (O(1)).
+
+        Args:
+            vertex_id: Vertex ID
+
+        Returns:
+            List of firefighter IDs (empty if none); do not mutate
+        """
+        return self._ff_by_position.get(vertex_id, [])
+
+    def _set_position(self, ff: Firefighter, vertex_id: str):
+        """Move ff to vertex_id, keeping the position index in sync."""
+        if ff.position == vertex_id:
+            return
+
+        old_ids = self._ff_by_position[ff.position]
+        old_ids.remove(ff.id)
+        if not old_ids:
+            del self._ff_by_position[ff.position]
+
+        # Keep creation order (the order of self.firefighters); lists hold
+        # the few firefighters sharing a vertex, so ranking them is cheap
+        rank = self._ff_rank
+        new_ids = self._ff_by_position.setdefault(vertex_id, [])
+        position = bisect.bisect([rank[ff_id] for ff_id in new_ids], rank[ff.id])
+        new_ids.insert(position, ff.id)
+
+        ff.position = vertex_id
 
     def _execute_action(self, ff: Firefighter, action: Dict[str, Any]) -> Tuple[bool, str, int]:
         """
@@ -592,7 +944,7 @@ class Simulation:
                 return False, 'teleport_requires_exits', 0
 
             # Instant teleport (zero cost, zero time)
-            ff.position = target_vertex
+            self._set_position(ff, target_vertex)
             ff.mark_visited(target_vertex)
             return True, 'teleported', 0
 
@@ -601,18 +953,11 @@ class Simulation:
             if target_vertex not in self.vertices:
                 return False, 'invalid_target', 0
 
-            # Check if adjacent
-            neighbors = [n for n, _ in self.adjacency[ff.position]]
-            if target_vertex not in neighbors:
+            # Check if adjacent (and find the edge)
+            edge_id = self.neighbor_edges[ff.position].get(target_vertex)
+            if edge_id is None:
                 return False, 'not_adjacent', 0
 
-            # Find the edge
-            edge_id = None
-            for neighbor, e_id in self.adjacency[ff.position]:
-                if neighbor == target_vertex:
-                    edge_id = e_id
-                    break
-
             edge = self.edges[edge_id]
             if not edge.exists:
                 return False, 'edge_blocked', 0
@@ -639,7 +984,7 @@ class Simulation:
             movement_cost = (current_node_weight + edge_weight) * carrying_multiplier
 
             # Move
-            ff.position = target_vertex
+            self._set_position(ff, target_vertex)
             ff.mark_visited(target_vertex)
             return True, 'moved', movement_cost
 
@@ -765,8 +1110,13 @@ class Simulation:
                 vertex.instructed_capable_count -= people_count
                 continue
 
-            # Find path to exit using BFS
-            path = self._bfs_path_to_exit(vertex_id, target_exit)
+            # Find path to exit using BFS (skipped when the exit is in another
+            # component: the search would only exhaust this one to fail)
+            components = self._component_labels()
+            if components[vertex_id] != components.get(target_exit):
+                path = None
+            else:
+                path = self._bfs_path_to_exit(vertex_id, target_exit)
 
             if not path or len(path) < 2:
                 # Trapped - no path available, stay in place
@@ -781,11 +1131,7 @@ class Simulation:
             next_vertex_id = path[1]
 
             # Find the edge
-            edge_id = None
-            for neighbor, e_id in self.adjacency[vertex_id]:
-                if neighbor == next_vertex_id:
-                    edge_id = e_id
-                    break
+            edge_id = self.neighbor_edges[vertex_id].get(next_vertex_id)
 
             if not edge_id:
                 continue
@@ -815,6 +1161,58 @@ class Simulation:
 
         return results
 
+    def _component_labels(self) -> Dict[str, str]:
+        """
+        Label every vertex with a representative of its connected component.
+
+        Built with union-find over existing edges and cached until the next
+        edge deletion (edges are only ever removed, never restored).
+
+        Returns:
+            {vertex_id: root_vertex_id}; two vertices are connected iff
+            their labels are equal
+        """
+        if self._components is not None:
+            return self._components
+
+        parent = {v_id: v_id for v_id in self.vertices}
+
+        def find(v_id: str) -> str:
+            while parent[v_id] != v_id:
+                parent[v_id] = parent[parent[v_id]]  # Path halving
+                v_id = parent[v_id]
+            return v_id
+
+        for edge in self.edges.values():
+            if edge.exists:
+                root_a = find(edge.vertex_a)
+                root_b = find(edge.vertex_b)
+                if root_a != root_b:
+                    parent[root_a] = root_b
+
+        self._components = {v_id: find(v_id) for v_id in self.vertices}
+        self._exit_components = {
+            self._components[v_id] for v_id, v in self.vertices.items()
+            if v.type in ['exit', 'window_exit']
+        }
+        return self._components
+
+    def exit_reachable(self, vertex_id: str) -> bool:
+        """
+        Check whether any exit can be reached from a vertex over existing edges.
+
+        O(1) lookup in the cached component labels, so it is cheap enough to
+        call every tick for every firefighter (e.g. trapped detection).
+
+        Args:
+            vertex_id: Vertex to check
+
+        Returns:
+            True if some exit shares the vertex's connected component
+        """
+        components = self._component_labels()
+        return components[vertex_id] in self._exit_components
+
     def _bfs_path_to_exit(self, start: str, target_exit: str) -> Optional[List[str]]:
         """Find path from start to target_exit using BFS (only through existing edges)"""
         from collections import deque
@@ -841,6 +1239,10 @@ class Simulation:
         """Find nearest exit from given vertex using BFS"""
         from collections import deque
 
+        # Cut off (trapped): the BFS would only exhaust the component to fail
+        if not self.exit_reachable(start_vertex):
+            return None
+
         queue = deque([start_vertex])
         visited = {start_vertex}
 
@@ -871,6 +1273,8 @@ class Simulation:
                 burn_prob = edge.get_burn_probability(self.tick, self.TICK_DURATION)
                 if self.rng.random() < burn_prob:
                     edge.exists = False
+                    self._graph_dirty = True
+                    self._components = None
                     events.append({
                         'type': 'edge_deleted',
                         'edge_id': edge.id,
@@ -878,8 +1282,9 @@ class Simulation:
                     })
 
         # Room burndown (smaller probability)
-        for vertex in self.vertices.values():
-            if not vertex.is_burned and vertex.type == 'room':
+        for room_id in self.room_ids:
+            vertex = self.vertices[room_id]
+            if not vertex.is_burned:
                 # Probability based on proximity to fire and room size
                 if self.fire_origin in self.vertices:
                     # Base probability
@@ -894,6 +1299,7 @@ class Simulation:
 
                     if self.rng.random() < burn_prob:
                         deaths = vertex.burn_down()
+                        self._graph_dirty = True
                         self.dead_count += deaths
                         events.append({
                             'type': 'room_burned',
@@ -907,13 +1313,15 @@ class Simulation:
         """
         Update fire intensity levels for all vertices.
         Fire intensity grows over time and spreads to adjacent rooms.
+
+        Runs over the link table from _build_fire_tables.
         """
-        new_intensities = {}
+        new_intensities = []
 
-        for vertex_id, vertex in self.vertices.items():
+        for vertex, links in self._fire_table:
             if vertex.is_burned:
                 # Burned rooms maintain high fire intensity
-                new_intensities[vertex_id] = 0.9
+                new_intensities.append(0.9)
                 continue
 
             current_intensity = vertex.fire_intensity
@@ -932,36 +1340,15 @@ class Simulation:
                 # Preheating bonus from adjacent burning rooms
                 # Research: "smoke spread accelerates preheating and combustion speed"
                 preheating_bonus = 0.0
-                for neighbor_id, edge_id in self.adjacency[vertex_id]:
-                    neighbor = self.vertices[neighbor_id]
-                    edge = self.edges[edge_id]
-
+                for neighbor, edge, width_factor, distance_factor, _, vertical_modifier in links:
                     if neighbor.fire_intensity > 0 and edge.exists:
                         # Each burning neighbor contributes to preheating via:
                         # - Radiant heat flux through corridor
                         # - Hot smoke accumulation
                         # - Convective heat transfer
-
-                        # Width factor: wider corridors = more heat/smoke transfer
-                        width_factor = edge.width / 2.0  # Normalized to 2m reference
-
-                        # Spatial distance factor: radiant heat decays with distance
-                        # Even if connected through hallway, farther rooms contribute less
-                        spatial_distance = self._get_spatial_distance(vertex_id, neighbor_id)
-                        if spatial_distance != float('inf'):
-                            # Inverse square law approximation for radiant heat
-                            # At 1 unit: 1.0× effect, at 2 units: 0.5× effect, at 3 units: 0.33× effect
-                            distance_factor = 1.0 / max(1.0, spatial_distance)
-                        else:
-                            # No position data: use graph connectivity only
-                            distance_factor = 1.0
-
-                        # Vertical fire spread modifier: fire spreads slower through floors
-                        vertical_modifier = 1.0
-                        if vertex.floor != neighbor.floor:
-                            # Fire spreading between floors (through staircases) - 30% slower
-                            vertical_modifier = 0.7
-
+                        # (width_factor: wider corridors = more transfer;
+                        # distance_factor: farther rooms contribute less;
+                        # vertical_modifier: slower through floors)
                         preheating_bonus += neighbor.fire_intensity * 0.0025 * width_factor * distance_factor * vertical_modifier
 
                 # Total growth = intrinsic + preheating acceleration
@@ -974,16 +1361,11 @@ class Simulation:
 
             # Fire spreads from adjacent burning rooms (ignition mechanism)
             # This mechanism is for IGNITION only, not continuous growth
-            for neighbor_id, edge_id in self.adjacency[vertex_id]:
-                neighbor = self.vertices[neighbor_id]
-                edge = self.edges[edge_id]
-
+            for neighbor, edge, _, _, width_factor, vertical_modifier in links:
                 # Fire spreads if neighbor is burning and corridor exists
                 if neighbor.fire_intensity > 0 and edge.exists:
                     # Fire spread rate depends on corridor width
-                    # Narrower corridors = faster spread (easier to fully ignite)
-                    # All edges have unit length, physical distance = UNIT_LENGTH
-                    width_factor = 2.0 / max(0.5, edge.width)  # Narrower = more spread (2m reference)
+                    # (width_factor: narrower = more spread) and floors
 
                     # Ignition taper: spread is strong for unignited rooms, weakens as room ignites
                     # At 0% fire: 1.0× spread (full ignition effect)
@@ -992,92 +1374,78 @@ class Simulation:
                     # This prevents continuous feedback loop while preserving 30-sec ignition
                     ignition_taper = max(0.0, 1.0 - current_intensity)
 
-                    # Vertical fire spread modifier: fire spreads slower through floors
-                    vertical_modifier = 1.0
-                    if vertex.floor != neighbor.floor:
-                        # Fire spreading between floors (through staircases) - 30% slower
-                        vertical_modifier = 0.7
-
                     spread_amount = neighbor.fire_intensity * 0.005 * width_factor * ignition_taper * vertical_modifier * self.TICK_DURATION
                     current_intensity = min(1.0, current_intensity + spread_amount)
 
-            new_intensities[vertex_id] = current_intensity
+            new_intensities.append(current_intensity)
 
         # Apply new intensities
-        for vertex_id, intensity in new_intensities.items():
-            self.vertices[vertex_id].fire_intensity = intensity
+        for (vertex, _), intensity in zip(self._fire_table, new_intensities):
+            vertex.fire_intensity = intensity
 
     def _update_smoke(self):
         """
         Update smoke amounts using volume-based diffusion model.
         Smoke is now in cubic meters, spreads based on corridor width.
+
+        Runs over the static link table from _build_smoke_tables, indexed
+        by vertex position: concentrations are computed once per vertex per
+        tick instead of twice per adjacency entry.
         """
-        new_smoke_amounts = {}
+        table = self._smoke_table
 
-        for vertex_id, vertex in self.vertices.items():
+        # Concentrations at the start of the tick (diffusion reads old amounts)
+        concentrations = [
+            vertex.smoke_amount / volume if volume > 0 else 0
+            for vertex, volume, _ in table
+        ]
+
+        new_smoke_amounts = []
+
+        for i, (vertex, volume, links) in enumerate(table):
             if vertex.is_burned:
                 # Burned rooms are completely filled with smoke
-                new_smoke_amounts[vertex_id] = vertex.volume
-            else:
-                # Start with 85% of current smoke (15% dissipates)
-                smoke_amount = vertex.smoke_amount * 0.85
-
-                # Smoke diffuses from neighbors based on corridor width
-                for neighbor_id, edge_id in self.adjacency[vertex_id]:
-                    neighbor = self.vertices[neighbor_id]
-                    edge = self.edges[edge_id]
-
-                    # Calculate concentration difference (drives diffusion)
-                    my_concentration = vertex.smoke_amount / vertex.volume if vertex.volume > 0 else 0
-                    neighbor_concentration = neighbor.smoke_amount / neighbor.volume if neighbor.volume > 0 else 0
-                    concentration_diff = neighbor_concentration - my_concentration
-
-                    if concentration_diff > 0:
-                        # Smoke flows from high to low concentration
-                        # Diffusion rate scales with corridor width (wider = more flow)
-                        # All edges have unit length, physical distance = UNIT_LENGTH
-                        # Base diffusion coefficient: 0.45 (balanced for moderate spread)
-                        width_factor = edge.width / 2.0  # Normalized to 2m reference
-                        diffusion_coefficient = 0.45 * width_factor
-
-                        # Vertical smoke spread modifier: smoke rises faster than it descends
-                        vertical_modifier = 1.0
-                        if neighbor.floor > vertex.floor:
-                            # Smoke flowing upward (neighbor is above current vertex) - faster
-                            vertical_modifier = 1.5
-                        elif neighbor.floor < vertex.floor:
-                            # Smoke flowing downward (neighbor is below current vertex) - slower
-                            vertical_modifier = 0.5
-
-                        # Amount of smoke that diffuses through this corridor
-                        smoke_flow = concentration_diff * diffusion_coefficient * vertical_modifier * min(vertex.volume, neighbor.volume)
-                        smoke_amount += smoke_flow
-
-                # Burning rooms generate smoke based on fire intensity
-                if vertex.fire_intensity > 0:
-                    # Generate smoke in cubic meters per second, scaled by fire intensity
-                    # Base rate: 5.0 m³/second at full intensity
-                    # Low intensity fire (0.3) → 1.5 m³/s
-                    # Full intensity fire (1.0) → 5.0 m³/s
-                    base_smoke_rate = 5.0  # m³/second at full intensity
-                    smoke_generation_rate = base_smoke_rate * vertex.fire_intensity
-                    smoke_generated = smoke_generation_rate * self.TICK_DURATION
-                    smoke_amount += smoke_generated
-
-                # Cap smoke at room volume
-                new_smoke_amounts[vertex_id] = min(vertex.volume, smoke_amount)
+                new_smoke_amounts.append(volume)
+                continue
+
+            # Start with 85% of current smoke (15% dissipates)
+            smoke_amount = vertex.smoke_amount * 0.85
+
+            # Smoke diffuses from neighbors based on corridor width
+            my_concentration = concentrations[i]
+            for neighbor_idx, diffusion_coefficient, vertical_modifier, min_volume in links:
+                # Calculate concentration difference (drives diffusion)
+                concentration_diff = concentrations[neighbor_idx] - my_concentration
+
+                if concentration_diff > 0:
+                    # Smoke flows from high to low concentration
+                    # Amount of smoke that diffuses through this corridor
+                    smoke_flow = concentration_diff * diffusion_coefficient * vertical_modifier * min_volume
+                    smoke_amount += smoke_flow
+
+            # Burning rooms generate smoke based on fire intensity
+            if vertex.fire_intensity > 0:
+                # Generate smoke in cubic meters per second, scaled by fire intensity
+                # Base rate: 5.0 m³/second at full intensity
+                # Low intensity fire (0.3) → 1.5 m³/s
+                # Full intensity fire (1.0) → 5.0 m³/s
+                base_smoke_rate = 5.0  # m³/second at full intensity
+                smoke_generation_rate = base_smoke_rate * vertex.fire_intensity
+                smoke_generated = smoke_generation_rate * self.TICK_DURATION
+                smoke_amount += smoke_generated
+
+            # Cap smoke at room volume
+            new_smoke_amounts.append(min(volume, smoke_amount))
 
         # Update all vertices
-        for vertex_id, smoke_amount in new_smoke_amounts.items():
-            self.vertices[vertex_id].smoke_amount = smoke_amount
+        for (vertex, _, _), smoke_amount in zip(table, new_smoke_amounts):
+            vertex.smoke_amount = smoke_amount
 
-    def read(self) -> Dict[str, Any]:
-        """
-        Return observable state for external model.
-        Model knows: building layout, current positions, discovered occupants, events
-        """
-        # Graph structure (always known from blueprints)
-        graph_structure = {
+    def _build_graph_structure(self) -> Dict[str, Any]:
+        """Build the observable graph dict (layout plus burn/exists flags)."""
+        return {
+            # New on every rebuild; pathfinding keys its caches on it
+            'version': next(_graph_versions),
             'vertices': {
                 v_id: {
                     'type': v.type,
@@ -1103,20 +1471,56 @@ class Simulation:
             }
         }
 
+    def _visited_list(self, ff: Firefighter) -> List[str]:
+        """List of ff.visited_vertices, rebuilt only when the set has changed."""
+        visited = ff.visited_vertices
+        cached = self._visited_lists.get(ff.id)
+        if cached is not None and cached[0] is visited and cached[1] == len(visited):
+            return cached[2]
+
+        visited_list = list(visited)
+        self._visited_lists[ff.id] = (visited, len(visited), visited_list)
+        return visited_list
+
+    def read(self) -> Dict[str, Any]:
+        """
+        Return observable state for external model.
+        Model knows: building layout, current positions, discovered occupants, events
+
+        The 'graph' entry is shared between calls until the graph changes, so
+        callers must treat it as read-only. A changed graph always comes back
+        as new dict objects with a new graph['version'] (unique within the
+        process), which models and pathfinding use to detect changes.
+        Each firefighter's 'visited_vertices' list is likewise shared until
+        that firefighter visits something new.
+
+        'discovered_totals' sums 'discovered_occupants' per type, so callers
+        polling overall progress need not iterate the dict themselves.
+        """
+        # Graph structure (always known from blueprints)
+        if self._graph_dirty:
+            self._graph_structure = self._build_graph_structure()
+            self._graph_dirty = False
+        graph_structure = self._graph_structure
+
         # Firefighter states
         firefighter_states = {}
         discovered_occupants = {}
+        total_capable = total_incapable = total_instructed = 0
 
         for ff_id, ff in self.firefighters.items():
             firefighter_states[ff_id] = {
                 'position': ff.position,
                 'carrying_incapable': ff.carrying_incapable,
                 'max_carry_capacity': ff.max_carry_capacity,
-                'visited_vertices': list(ff.visited_vertices)
+                'visited_vertices': self._visited_list(ff)
             }
 
-            # Discovered occupants (for all visited vertices)
+            # Discovered occupants (for all visited vertices); vertices another
+            # firefighter already reported carry identical counts
             for v_id in ff.visited_vertices:
+                if v_id in discovered_occupants:
+                    continue
                 if v_id in self.vertices:
                     vertex = self.vertices[v_id]
                     # Include all visited vertices (rooms, hallways, etc) except exits
@@ -1126,29 +1530,40 @@ class Simulation:
                             'incapable': vertex.incapable_count,
                             'instructed': vertex.instructed_capable_count
                         }
+                        total_capable += vertex.capable_count
+                        total_incapable += vertex.incapable_count
+                        total_instructed += vertex.instructed_capable_count
 
         return {
             'tick': self.tick,
             'graph': graph_structure,
             'firefighters': firefighter_states,
             'discovered_occupants': discovered_occupants,
+            'discovered_totals': {
+                'capable': total_capable,
+                'incapable': total_incapable,
+                'instructed': total_instructed
+            },
             'fire_origin': self.fire_origin
         }
 
+    @property
+    def remaining_occupants(self) -> int:
+        """Occupants not yet rescued or dead, including those being carried (O(1))"""
+        return self.total_initial_occupants - self.rescued_count - self.dead_count
+
+    def is_done(self) -> bool:
+        """True once every occupant has been rescued or has died (O(1))"""
+        return self.remaining_occupants == 0
+
     def get_stats(self) -> Dict[str, Any]:
         """Return performance statistics"""
-        # Count all occupants (capable, incapable, instructed) + those being carried
-        total_occupants = sum(
-            v.capable_count + v.incapable_count + v.instructed_capable_count
-            for v in self.vertices.values()
-        )
-        total_carrying = sum(ff.carrying_incapable for ff in self.firefighters.values())
-
         return {
             'tick': self.tick,
             'rescued': self.rescued_count,
             'dead': self.dead_count,
-            'remaining': total_occupants + total_carrying,
-            'total_initial': self.rescued_count + self.dead_count + total_occupants + total_carrying,
+            # All occupants (capable, incapable, instructed) + those being carried
+            'remaining': self.remaining_occupants,
+            'total_initial': self.total_initial_occupants,
             'time_minutes': (self.tick * self.TICK_DURATION) / 60.0  # Convert to minutes
         }
@@ -9,9 +9,11 @@ This module implements a systematic building sweep using:
 4. DFS 2× traversal path generation
 """
 
+import heapq
 import random
+from collections import deque
 from typing import Dict, List, Set, Tuple
-from pathfinding import bfs_next_step, dijkstra_single_source, bfs_path_with_edges
+from pathfinding import bfs_next_step, dijkstra_predecessors, bfs_path_with_edges
 
 
 class SweepCoordinator:
@@ -26,16 +28,18 @@ class SweepCoordinator:
     - Instruct capable occupants during sweep
     """
 
-    def __init__(self, num_firefighters: int, seed: int = None):
+    def __init__(self, num_firefighters: int, seed: int = None, verbose: bool = True):
         """
         Initialize sweep coordinator.
 
         Args:
             num_firefighters: Number of firefighters (K for K-medoids)
             seed: Random seed for deterministic k-medoids clustering (None for random)
+            verbose: If False, skip progress logging (default True)
         """
         self.num_firefighters = num_firefighters
         self.seed = seed
+        self.verbose = verbose
         self.partitions = {}  # {ff_id: [room_ids]}
         self.sweep_paths = {}  # {ff_id: [vertex_ids]}
         self.ff_to_exit = {}  # {ff_id: exit_id}
@@ -47,6 +51,20 @@ class SweepCoordinator:
         self.ticks_since_progress = 0  # Track stalled progress
         self.last_visited_count = 0
 
+        # Room IDs never change during a run; computed on first use
+        self.room_list = None  # [room_ids] in graph order
+        self.all_rooms = None  # frozenset of room_ids
+
+        # Corridor distance cache: one BFS per source answers every target
+        self._bfs_cache = {}  # {start: {vertex_id: hops}}
+        self._bfs_adjacency = {}  # {vertex_id: [neighbor_ids]}
+        self._bfs_graph_version = None  # graph['version'] the cache was checked against
+        self._bfs_edges_key = None  # Traversable edge set the cache was built from
+
+        # Last _hash_graph result, reused while sim.read() returns the same graph version
+        self._hash_graph_version = None
+        self._hash_value = None
+
     def initialize_sweep(self, state: Dict):
         """
         One-time setup at simulation start.
@@ -63,10 +81,7 @@ class SweepCoordinator:
         edges = graph['edges']
 
         # Find all rooms and exits
-        rooms = [
-            v_id for v_id, v_data in vertices.items()
-            if v_data['type'] == 'room'
-        ]
+        rooms = list(self._get_room_list(graph))
         exits = [
             v_id for v_id, v_data in vertices.items()
             if v_data['type'] == 'exit'
@@ -123,7 +138,8 @@ class SweepCoordinator:
         # Check if graph has changed (edges burned) and trigger replan
         current_hash = self._hash_graph(graph)
         if self.last_graph_hash is not None and current_hash != self.last_graph_hash:
-            print(f"\n🔥 Graph changed during sweep - replanning! (replan #{self.replan_count + 1})")
+            if self.verbose:
+                print(f"\n🔥 Graph changed during sweep - replanning! (replan #{self.replan_count + 1})")
             self._replan_sweep(state)
             self.replan_count += 1
 
@@ -132,6 +148,7 @@ class SweepCoordinator:
         actions = {}
         vertices = graph['vertices']
         discovered = state.get('discovered_occupants', {})
+        all_rooms = self._get_all_rooms(graph)
 
         for ff_id, ff_data in state['firefighters'].items():
             ff_actions = []
@@ -183,25 +200,23 @@ class SweepCoordinator:
                         continue
 
                     # Priority 2: Find unvisited rooms
-                    all_rooms = {
-                        v_id for v_id, v_data in vertices.items()
-                        if v_data['type'] == 'room'
-                    }
                     unvisited_rooms = all_rooms - self.globally_visited
 
                     if unvisited_rooms:
-                        # Sort unvisited rooms by distance
-                        room_distances = [
-                            (r, self._bfs_distance(ff_pos, r, graph))
-                            for r in unvisited_rooms
-                        ]
-                        sorted_unvisited = sorted(room_distances, key=lambda x: x[1])
+                        # Nearest-first candidates as a heap; the first pop almost
+                        # always yields a move, so a full sort is wasted work.
+                        # The index keeps ties in iteration order (stable sort).
+                        room_heap = []
+                        for i, r in enumerate(unvisited_rooms):
+                            dist = self._bfs_distance(ff_pos, r, graph)
+                            # Skip if unreachable
+                            if dist != float('inf'):
+                                room_heap.append((dist, i, r))
+                        heapq.heapify(room_heap)
 
                         moved = False
-                        for target_room, dist in sorted_unvisited:
-                            # Skip if unreachable
-                            if dist == float('inf'):
-                                continue
+                        while room_heap:
+                            dist, _, target_room = heapq.heappop(room_heap)
 
                             next_step = bfs_next_step(ff_pos, target_room, graph)
                             if next_step:
@@ -276,12 +291,7 @@ class SweepCoordinator:
             True if all rooms visited OR all remaining rooms unreachable
         """
         graph = state['graph']
-        vertices = graph['vertices']
-
-        all_rooms = {
-            v_id for v_id, v_data in vertices.items()
-            if v_data['type'] == 'room'
-        }
+        all_rooms = self._get_all_rooms(graph)
 
         # Check if all rooms visited
         if all_rooms.issubset(self.globally_visited):
@@ -315,11 +325,12 @@ class SweepCoordinator:
         if all_at_exits_with_completed_paths and self.ticks_since_progress >= 2:
             # All firefighters at exits, paths complete, and no progress for 2+ ticks
             unvisited_rooms = all_rooms - self.globally_visited
-            print(f"\n✓ All firefighters at exits with completed sweep paths")
-            print(f"   Visited: {len(self.globally_visited)}/{len(all_rooms)} rooms")
-            if unvisited_rooms:
-                print(f"   {len(unvisited_rooms)} rooms unreachable (blocked by fire)")
-            print(f"   Switching to rescue phase...")
+            if self.verbose:
+                print(f"\n✓ All firefighters at exits with completed sweep paths")
+                print(f"   Visited: {len(self.globally_visited)}/{len(all_rooms)} rooms")
+                if unvisited_rooms:
+                    print(f"   {len(unvisited_rooms)} rooms unreachable (blocked by fire)")
+                print(f"   Switching to rescue phase...")
             return True
 
         # Only check reachability if stalled for 20+ ticks (expensive operation)
@@ -343,12 +354,44 @@ class SweepCoordinator:
                     return False
 
         # All unvisited rooms are unreachable - force phase transition
-        print(f"\n⚠️  All unvisited rooms unreachable ({len(unvisited_rooms)} rooms cut off by fire)")
-        print(f"   Visited: {len(self.globally_visited)}/{len(all_rooms)} rooms")
-        print(f"   Stalled for {self.ticks_since_progress} ticks")
-        print(f"   Forcing phase transition to rescue mode...")
+        if self.verbose:
+            print(f"\n⚠️  All unvisited rooms unreachable ({len(unvisited_rooms)} rooms cut off by fire)")
+            print(f"   Visited: {len(self.globally_visited)}/{len(all_rooms)} rooms")
+            print(f"   Stalled for {self.ticks_since_progress} ticks")
+            print(f"   Forcing phase transition to rescue mode...")
         return True
 
+    def _get_room_list(self, graph: Dict) -> List[str]:
+        """
+        Room IDs in graph order (cached; the room set is static).
+
+        Args:
+            graph: Graph structure
+
+        Returns:
+            List of room IDs (do not mutate)
+        """
+        if self.room_list is None:
+            self.room_list = [
+                v_id for v_id, v_data in graph['vertices'].items()
+                if v_data['type'] == 'room'
+            ]
+        return self.room_list
+
+    def _get_all_rooms(self, graph: Dict) -> frozenset:
+        """
+        Set of all room IDs (cached; the room set is static).
+
+        Args:
+            graph: Graph structure
+
+        Returns:
+            frozenset of room IDs
+        """
+        if self.all_rooms is None:
+            self.all_rooms = frozenset(self._get_room_list(graph))
+        return self.all_rooms
+
     def _k_medoids_partition(
         self,
         rooms: List[str],
@@ -434,15 +477,12 @@ class SweepCoordinator:
         for room_a in cluster_rooms:
             complete_graph[room_a] = {}
 
-            # Use Dijkstra to get all distances from room_a
-            # dijkstra_single_source(graph, start) returns {vertex: (distance, path)}
-            result = dijkstra_single_source(graph, room_a)
+            # Use Dijkstra to get all distances from room_a (paths not needed)
+            distances, _ = dijkstra_predecessors(graph, room_a)
 
             for room_b in cluster_rooms:
                 if room_a != room_b:
-                    # Extract distance from tuple (distance, path)
-                    dist_tuple = result.get(room_b, (float('inf'), []))
-                    complete_graph[room_a][room_b] = dist_tuple[0]
+                    complete_graph[room_a][room_b] = distances.get(room_b, float('inf'))
 
         return complete_graph
 
@@ -461,7 +501,6 @@ class SweepCoordinator:
         Returns:
             MST as adjacency list {room: [neighbors]}
         """
-        import heapq
 
         if not rooms:
             return {}
@@ -549,37 +588,78 @@ class SweepCoordinator:
         if start == end:
             return 0.0
 
-        from collections import deque
+        return self._bfs_distances(start, graph).get(end, float('inf'))
 
-        queue = deque([(start, 0)])
-        visited = {start}
-        edges = graph['edges']
+    def _bfs_distances(self, start: str, graph: Dict) -> Dict[str, int]:
+        """
+        Hop distances from start to every reachable vertex.
+
+        One O(V+E) sweep serves all targets; results are cached per source
+        until the traversable edge set changes.
+
+        Args:
+            start: Start vertex ID
+            graph: Graph structure
+
+        Returns:
+            {vertex_id: hops} for reachable vertices (start maps to 0)
+        """
+        self._sync_bfs_cache(graph)
+
+        distances = self._bfs_cache.get(start)
+        if distances is not None:
+            return distances
+
+        distances = {start: 0}
+        queue = deque([start])
 
         while queue:
-            current, dist = queue.popleft()
+            current = queue.popleft()
+            next_dist = distances[current] + 1
 
-            # Check all edges from current vertex
-            for edge_id, edge_data in edges.items():
-                if edge_data.get('is_burned'):
-                    continue
+            for neighbor in self._bfs_adjacency.get(current, ()):
+                if neighbor not in distances:
+                    distances[neighbor] = next_dist
+                    queue.append(neighbor)
 
-                vertex_a = edge_data['vertex_a']
-                vertex_b = edge_data['vertex_b']
+        self._bfs_cache[start] = distances
+        return distances
 
-                neighbor = None
-                if vertex_a == current:
-                    neighbor = vertex_b
-                elif vertex_b == current:
-                    neighbor = vertex_a
+    def _sync_bfs_cache(self, graph: Dict):
+        """
+        Drop cached BFS results if the traversable edges changed.
 
-                if neighbor and neighbor not in visited:
-                    if neighbor == end:
-                        return dist + 1
+        Args:
+            graph: Graph structure
+        """
+        # Unchanged since last check (graphs without a version are rechecked)
+        version = graph.get('version')
+        if version is not None and version == self._bfs_graph_version:
+            return
+
+        edges = graph['edges']
+        edges_key = frozenset(
+            edge_id for edge_id, edge_data in edges.items()
+            if not edge_data.get('is_burned')
+        )
+        self._bfs_graph_version = version
+
+        if edges_key == self._bfs_edges_key:
+            return
+
+        adjacency = {}
+        for edge_id, edge_data in edges.items():
+            if edge_data.get('is_burned'):
+                continue
 
-                    visited.add(neighbor)
-                    queue.append((neighbor, dist + 1))
+            vertex_a = edge_data['vertex_a']
+            vertex_b = edge_data['vertex_b']
+            adjacency.setdefault(vertex_a, []).append(vertex_b)
+            adjacency.setdefault(vertex_b, []).append(vertex_a)
 
-        return float('inf')
+        self._bfs_adjacency = adjacency
+        self._bfs_edges_key = edges_key
+        self._bfs_cache = {}
 
     def _find_nearest_exit(self, room: str, graph: Dict, state: Dict) -> str:
         """
@@ -614,12 +694,17 @@ class SweepCoordinator:
         Returns:
             Hash of burned edges
         """
-        edges = graph['edges']
+        version = graph.get('version')
+        if version is not None and version == self._hash_graph_version:
+            return self._hash_value  # Same graph version as last tick
+
         burned_edges = tuple(sorted([
-            edge_id for edge_id, edge_data in edges.items()
+            edge_id for edge_id, edge_data in graph['edges'].items()
             if edge_data.get('is_burned', False)
         ]))
-        return hash(burned_edges)
+        self._hash_graph_version = version
+        self._hash_value = hash(burned_edges)
+        return self._hash_value
 
     def _replan_sweep(self, state: Dict):
         """
@@ -634,27 +719,26 @@ class SweepCoordinator:
         Args:
             state: Current simulation state
         """
-        print(f"  Replanning sweep: {len(self.globally_visited)} rooms already visited")
+        if self.verbose:
+            print(f"  Replanning sweep: {len(self.globally_visited)} rooms already visited")
 
         graph = state['graph']
-        vertices = graph['vertices']
 
         # Find unvisited rooms
-        all_rooms = [
-            v_id for v_id, v_data in vertices.items()
-            if v_data['type'] == 'room'
-        ]
+        all_rooms = self._get_room_list(graph)
 
         unvisited_rooms = [
             room for room in all_rooms
             if room not in self.globally_visited
         ]
 
-        print(f"  Unvisited rooms: {len(unvisited_rooms)}/{len(all_rooms)}")
+        if self.verbose:
+            print(f"  Unvisited rooms: {len(unvisited_rooms)}/{len(all_rooms)}")
 
         if len(unvisited_rooms) == 0:
             # All rooms visited - no need to replan
-            print(f"  All rooms visited - no replanning needed")
+            if self.verbose:
+                print(f"  All rooms visited - no replanning needed")
             return
 
         # Re-partition unvisited rooms
@@ -690,6 +774,8 @@ class SweepCoordinator:
             self.sweep_paths[ff_id] = dfs_path
             self.current_path_index[ff_id] = 0
 
-            print(f"    {ff_id}: Assigned {len(cluster_rooms)} unvisited rooms")
+            if self.verbose:
+                print(f"    {ff_id}: Assigned {len(cluster_rooms)} unvisited rooms")
 
-        print(f"  Replanning complete")
+        if self.verbose:
+            print(f"  Replanning complete")
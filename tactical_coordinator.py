@@ -112,8 +112,14 @@ class TacticalCoordinator:
     - Transition between items when complete
     """
 
-    def __init__(self):
-        """Initialize coordinator."""
+    def __init__(self, verbose: bool = True):
+        """
+        Initialize coordinator.
+
+        Args:
+            verbose: If False, skip progress logging (default True)
+        """
+        self.verbose = verbose
         self.ff_plans = {}  # {ff_id: [ItemExecutionPlan, ...]}
         self.ff_current_idx = {}  # {ff_id: current_item_index}
 
@@ -128,7 +134,8 @@ class TacticalCoordinator:
             self.ff_plans[ff_id] = [ItemExecutionPlan(item) for item in items]
             self.ff_current_idx[ff_id] = 0
 
-        print(f"Tactical coordinator loaded {len(assignments)} firefighter assignments")
+        if self.verbose:
+            print(f"Tactical coordinator loaded {len(assignments)} firefighter assignments")
 
     def get_actions_for_tick(self, state: Dict) -> Dict[str, List[Dict]]:
         """
@@ -189,7 +196,8 @@ class TacticalCoordinator:
         carrying = ff_state['carrying_incapable']
         if plan.is_complete(carrying):
             # Advance to next item
-            print(f"  {ff_id}: Completed item {idx+1}/{len(queue)}")
+            if self.verbose:
+                print(f"  {ff_id}: Completed item {idx+1}/{len(queue)}")
             self.ff_current_idx[ff_id] = idx + 1
             return self._get_current_plan(ff_id, ff_state)  # Recursive
 
@@ -14,13 +14,12 @@ Examples:
 """
 
 import sys
-import json
 import random
 import os
 
 sys.path.insert(0, '/Users/skyliu/HiMCM2025')
 
-from simulator import Simulation
+from simulator import Simulation, load_config
 from optimal_rescue_model import OptimalRescueModel
 from visualizer import EvacuationVisualizer
 
@@ -80,8 +79,7 @@ def main():
 
     print(f"Loading building from: {config_file}")
 
-    with open(config_file, 'r') as f:
-        config = json.load(f)
+    config = load_config(config_file)
 
     # Identify building type
     building_name = get_building_name(config_file)
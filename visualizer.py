@@ -4,10 +4,9 @@ Interactive visualization tool for the evacuation simulator with manual control
 """
 
 import pygame
-import json
 import math
 from typing import Dict, List, Tuple, Optional
-from simulator import Simulation
+from simulator import Simulation, load_config
 
 
 # Colors
@@ -33,6 +32,38 @@ COLORS = {
     'button_text': (255, 255, 255),
 }
 
+# Default-font objects by point size. pygame.font.Font(None, size) reloads
+# the font file on every call, and drawing needs several per entity per frame.
+_font_cache: Dict[int, pygame.font.Font] = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """Return the default pygame font at the given size, loading it once."""
+    font = _font_cache.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _font_cache[size] = font
+    return font
+
+
+# Rendered smoke halos by (radius, RGBA color); smoke levels map to a small
+# set of integer radii and alphas, so most frames reuse an existing surface
+_smoke_sprite_cache: Dict[Tuple[int, Tuple[int, int, int, int]], pygame.Surface] = {}
+_SMOKE_SPRITE_CACHE_SIZE = 1024
+
+
+def get_smoke_sprite(radius: int, color: Tuple[int, int, int, int]) -> pygame.Surface:
+    """Return a transparent surface with a filled smoke circle, rendered once."""
+    key = (radius, color)
+    sprite = _smoke_sprite_cache.get(key)
+    if sprite is None:
+        if len(_smoke_sprite_cache) >= _SMOKE_SPRITE_CACHE_SIZE:
+            _smoke_sprite_cache.clear()
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        _smoke_sprite_cache[key] = sprite
+    return sprite
+
 
 class LayoutVisualizer:
     """Handles the visual representation of the building layout"""
@@ -41,10 +72,14 @@ class LayoutVisualizer:
         self.width = width
         self.height = height
         self.vertex_positions: Dict[str, Tuple[float, float]] = {}
+        # Per-vertex (radius, base color, area); area and type never change,
+        # so these are computed on first draw instead of every frame
+        self.vertex_shapes: Dict[str, Tuple[int, Tuple[int, int, int], float]] = {}
         self.layout_calculated = False
 
     def calculate_layout(self, sim: Simulation):
         """Calculate positions for all vertices using manual or automatic layout"""
+        self.vertex_shapes.clear()
 
         # Check if we have a manual layout for this configuration
         if self._try_manual_layout(sim):
@@ -151,6 +186,29 @@ class LayoutVisualizer:
 
                 self.vertex_positions[room_id] = (x, y)
 
+    def _vertex_shape(self, vertex) -> Tuple[int, Tuple[int, int, int], float]:
+        """Radius, base color and area of a vertex's circle (static per vertex)"""
+        # Calculate radius based on area (in square meters)
+        # Use square root scaling so visual area is proportional to actual area
+        # radius ∝ sqrt(area) means π*r² ∝ area
+        area = vertex.area if hasattr(vertex, 'area') else 100.0
+
+        # Enhanced scaling to make size differences more visible
+        # Scale factor: sqrt(area) * 6.0 makes differences more apparent
+        base_radius = math.sqrt(area) * 6.0
+
+        # Apply type-specific adjustments with lower minimums
+        if vertex.type in ['exit', 'window_exit']:
+            radius = max(12, int(base_radius * 0.6))  # Exits
+            color = COLORS['exit'] if vertex.type == 'exit' else COLORS['window_exit']
+        elif vertex.type in ['hallway', 'corridor', 'intersection', 'stair']:
+            radius = max(8, int(base_radius * 0.4))  # Hallways, corridors, intersections, stairs (smallest)
+            color = COLORS['hallway']
+        else:  # room
+            radius = max(10, int(base_radius))  # Rooms (variable size, low minimum)
+            color = COLORS['room']
+        return radius, color, area
+
     def draw_edge(self, screen: pygame.Surface, edge_id: str, sim: Simulation):
         """Draw an edge (corridor)"""
         edge = sim.edges[edge_id]
@@ -204,48 +262,35 @@ class LayoutVisualizer:
         vertex = sim.vertices[vertex_id]
         pos = self.vertex_positions[vertex_id]
 
-        # Calculate radius based on area (in square meters)
-        # Use square root scaling so visual area is proportional to actual area
-        # radius ∝ sqrt(area) means π*r² ∝ area
-        area = vertex.area if hasattr(vertex, 'area') else 100.0
-
-        # Enhanced scaling to make size differences more visible
-        # Scale factor: sqrt(area) * 6.0 makes differences more apparent
-        base_radius = math.sqrt(area) * 6.0
-
-        # Apply type-specific adjustments with lower minimums
-        if vertex.type in ['exit', 'window_exit']:
-            radius = max(12, int(base_radius * 0.6))  # Exits
-            color = COLORS['exit'] if vertex.type == 'exit' else COLORS['window_exit']
-        elif vertex.type in ['hallway', 'corridor', 'intersection', 'stair']:
-            radius = max(8, int(base_radius * 0.4))  # Hallways, corridors, intersections, stairs (smallest)
-            color = COLORS['hallway']
-        else:  # room
-            radius = max(10, int(base_radius))  # Rooms (variable size, low minimum)
-            color = COLORS['room']
+        shape = self.vertex_shapes.get(vertex_id)
+        if shape is None:
+            shape = self._vertex_shape(vertex)
+            self.vertex_shapes[vertex_id] = shape
+        radius, color, area = shape
 
         # Modify color if burned
         if vertex.is_burned:
             color = COLORS['fire']
 
+        smoke_level = vertex.smoke_level  # Computed property; read once
+
         # Draw smoke overlay - make it more visible
-        if vertex.smoke_level > 0.05:
+        if smoke_level > 0.05:
             # Make smoke extend beyond the vertex for better visibility
-            smoke_radius = int(radius * (1 + vertex.smoke_level * 0.5))
-            smoke_surface = pygame.Surface((smoke_radius * 2, smoke_radius * 2), pygame.SRCALPHA)
+            smoke_radius = int(radius * (1 + smoke_level * 0.5))
 
             # More visible smoke colors with stronger alpha (clamped to 255)
-            if vertex.smoke_level < 0.3:
-                alpha = min(255, int(100 + vertex.smoke_level * 400))
+            if smoke_level < 0.3:
+                alpha = min(255, int(100 + smoke_level * 400))
                 smoke_color = (150, 150, 150, alpha)
-            elif vertex.smoke_level < 0.7:
-                alpha = min(255, int(150 + vertex.smoke_level * 250))
+            elif smoke_level < 0.7:
+                alpha = min(255, int(150 + smoke_level * 250))
                 smoke_color = (100, 100, 100, alpha)
             else:
-                alpha = min(255, int(200 + vertex.smoke_level * 55))
+                alpha = min(255, int(200 + smoke_level * 55))
                 smoke_color = (50, 50, 50, alpha)
 
-            pygame.draw.circle(smoke_surface, smoke_color, (smoke_radius, smoke_radius), smoke_radius)
+            smoke_surface = get_smoke_sprite(smoke_radius, smoke_color)
             screen.blit(smoke_surface, (pos[0] - smoke_radius, pos[1] - smoke_radius))
 
         # Draw main circle
@@ -260,7 +305,7 @@ class LayoutVisualizer:
 
         # Draw area label for all rooms (showing size in m²)
         if vertex.type == 'room':
-            font_tiny = pygame.font.Font(None, 14)
+            font_tiny = get_font(14)
             area_text = f"{area:.1f}m²"
             text = font_tiny.render(area_text, True, (100, 100, 100))
             text_rect = text.get_rect(center=(pos[0], pos[1] - radius - 8))
@@ -275,7 +320,7 @@ class LayoutVisualizer:
             total_occupants = vertex.capable_count + vertex.incapable_count + vertex.instructed_capable_count
 
             if is_visible and total_occupants > 0:
-                font = pygame.font.Font(None, 18)
+                font = get_font(18)
                 # Display format: C:# I:# →:#
                 display_text = f"C:{vertex.capable_count} I:{vertex.incapable_count}"
                 if vertex.instructed_capable_count > 0:
@@ -287,15 +332,15 @@ class LayoutVisualizer:
                 screen.blit(text, text_rect)
             elif not is_visible and not vertex.is_burned:
                 # Show "?" for unvisited rooms
-                font = pygame.font.Font(None, 24)
+                font = get_font(24)
                 text = font.render('?', True, (150, 150, 150))
                 text_rect = text.get_rect(center=pos)
                 screen.blit(text, text_rect)
 
             # Draw smoke level percentage if significant (always visible for rooms)
-            if vertex.smoke_level > 0.2:
-                font_small = pygame.font.Font(None, 16)
-                smoke_text = f"{int(vertex.smoke_level * 100)}%"
+            if smoke_level > 0.2:
+                font_small = get_font(16)
+                smoke_text = f"{int(smoke_level * 100)}%"
                 text = font_small.render(smoke_text, True, (255, 50, 50))
                 # Position below occupant count
                 text_rect = text.get_rect(center=(pos[0], pos[1] + 20))
@@ -304,7 +349,7 @@ class LayoutVisualizer:
         # Draw instructed people in hallways/corridors (people in transit)
         if vertex.type in ['hallway', 'stairwell'] and vertex.instructed_capable_count > 0:
             # Draw small person icons moving through corridor
-            font = pygame.font.Font(None, 18)
+            font = get_font(18)
             transit_text = f"→{vertex.instructed_capable_count}"
             text = font.render(transit_text, True, (0, 150, 100))
             text_rect = text.get_rect(center=(pos[0], pos[1] + 5))
@@ -317,16 +362,16 @@ class LayoutVisualizer:
             screen.blit(text, text_rect)
 
             # Draw smoke level percentage if significant (always visible)
-            if vertex.smoke_level > 0.2:
-                font_small = pygame.font.Font(None, 16)
-                smoke_text = f"{int(vertex.smoke_level * 100)}%"
+            if smoke_level > 0.2:
+                font_small = get_font(16)
+                smoke_text = f"{int(smoke_level * 100)}%"
                 text = font_small.render(smoke_text, True, (255, 50, 50))
                 # Position below occupant count
                 text_rect = text.get_rect(center=(pos[0], pos[1] + 20))
                 screen.blit(text, text_rect)
 
         # Draw label
-        font_small = pygame.font.Font(None, 16)
+        font_small = get_font(16)
         label = vertex_id.replace('_', ' ').title()
         if len(label) > 15:
             label = vertex_id.split('_')[-1].title()
@@ -347,10 +392,7 @@ class LayoutVisualizer:
 
         # Count firefighters at same position and get this one's index
         if firefighters_at_same_pos is None:
-            firefighters_at_same_pos = [
-                fid for fid, f in sim.firefighters.items()
-                if f.position == ff.position
-            ]
+            firefighters_at_same_pos = sim.firefighters_at(ff.position)
 
         ff_count = len(firefighters_at_same_pos)
         ff_index = firefighters_at_same_pos.index(ff_id)
@@ -377,7 +419,7 @@ class LayoutVisualizer:
         pygame.draw.circle(screen, COLORS['wall'], pos, 12, 2)
 
         # Draw ID
-        font_small = pygame.font.Font(None, 14)
+        font_small = get_font(14)
         text = font_small.render(ff_id, True, COLORS['text'])
         text_rect = text.get_rect(center=(pos[0], pos[1] - 20))
         screen.blit(text, text_rect)
@@ -389,7 +431,7 @@ class LayoutVisualizer:
             pygame.draw.circle(screen, (255, 200, 0), badge_pos, 10)
             pygame.draw.circle(screen, COLORS['wall'], badge_pos, 10, 1)
             # Draw count
-            font_tiny = pygame.font.Font(None, 16)
+            font_tiny = get_font(16)
             text = font_tiny.render(f"x{ff_count}", True, COLORS['text'])
             text_rect = text.get_rect(center=badge_pos)
             screen.blit(text, text_rect)
@@ -399,7 +441,7 @@ class LayoutVisualizer:
             carry_badge_pos = (pos[0] + 15, pos[1] + 15)
             pygame.draw.circle(screen, (100, 200, 255), carry_badge_pos, 8)
             pygame.draw.circle(screen, COLORS['wall'], carry_badge_pos, 8, 1)
-            font_tiny = pygame.font.Font(None, 14)
+            font_tiny = get_font(14)
             text = font_tiny.render("C", True, COLORS['text'])
             text_rect = text.get_rect(center=carry_badge_pos)
             screen.blit(text, text_rect)
@@ -436,7 +478,7 @@ class Button:
         pygame.draw.rect(screen, color, self.rect, border_radius=5)
         pygame.draw.rect(screen, COLORS['wall'], self.rect, 2, border_radius=5)
 
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         text = font.render(self.text, True, COLORS['button_text'])
         text_rect = text.get_rect(center=self.rect.center)
         screen.blit(text, text_rect)
@@ -456,6 +498,9 @@ class EvacuationVisualizer:
 
     def __init__(self, width: int = 1200, height: int = 800, manual_mode: bool = False):
         pygame.init()
+        # Fonts and sprites from an earlier pygame session are invalid
+        _font_cache.clear()
+        _smoke_sprite_cache.clear()
         self.width = width
         self.height = height
         self.screen = pygame.display.set_mode((width, height))
@@ -472,6 +517,11 @@ class EvacuationVisualizer:
         # Manual mode: queue actions instead of executing immediately
         self.pending_actions: Dict[str, List] = {}
 
+        # Union of all firefighters' visited vertices (fog of war), rebuilt
+        # only when some firefighter's visited set changes
+        self._all_visited: set = set()
+        self._all_visited_key: Optional[tuple] = None
+
         # Multi-floor support
         self.current_floor: Optional[int] = None  # None = show all floors
         self.num_floors = 1  # Will be updated when simulation loads
@@ -524,8 +574,8 @@ class EvacuationVisualizer:
         pygame.draw.rect(screen, (255, 250, 240), panel_rect)
         pygame.draw.rect(screen, COLORS['wall'], panel_rect, 2)
 
-        font_title = pygame.font.Font(None, 22)
-        font_small = pygame.font.Font(None, 18)
+        font_title = get_font(22)
+        font_small = get_font(18)
 
         y = panel_y + 10
 
@@ -535,9 +585,9 @@ class EvacuationVisualizer:
         y += 30
 
         # Count burned vertices/edges
-        burned_rooms = sum(1 for v in sim.vertices.values() if v.is_burned and v.type == 'room')
+        burned_rooms = sum(1 for v_id in sim.room_ids if sim.vertices[v_id].is_burned)
         burned_edges = sum(1 for e in sim.edges.values() if not e.exists)
-        total_rooms = sum(1 for v in sim.vertices.values() if v.type == 'room')
+        total_rooms = len(sim.room_ids)
         total_edges = len(sim.edges)
 
         # Burned stats
@@ -586,8 +636,8 @@ class EvacuationVisualizer:
         pygame.draw.line(screen, COLORS['wall'], (0, panel_y), (self.width, panel_y), 2)
 
         # Draw stats
-        font = pygame.font.Font(None, 28)
-        font_small = pygame.font.Font(None, 20)
+        font = get_font(28)
+        font_small = get_font(20)
 
         y = panel_y + 10
 
@@ -668,7 +718,7 @@ class EvacuationVisualizer:
                 pygame.draw.circle(screen, (0, 0, 0), (int(x), int(y)), 22, 2)
 
         # Draw legend in top-left corner
-        font_small = pygame.font.Font(None, 16)
+        font_small = get_font(16)
         legend_y = 10
         legend_x = 10
 
@@ -712,14 +762,26 @@ class EvacuationVisualizer:
         if self.num_floors > 1:
             self._create_buttons()
 
+        # Endpoint floors of each edge (static), for the per-frame floor filter
+        edge_floors = {}
+        for edge_id, edge in sim.edges.items():
+            vertex_a = sim.vertices.get(edge.vertex_a)
+            vertex_b = sim.vertices.get(edge.vertex_b)
+            if vertex_a and vertex_b:
+                edge_floors[edge_id] = (getattr(vertex_a, 'floor', 1), getattr(vertex_b, 'floor', 1))
+
         running = True
         ticks_since_update = 0
+        # The frame only changes on input or a simulation step; frames in
+        # between would redraw identical output, so they are skipped
+        needs_redraw = True
 
         while running:
             dt = self.clock.tick(60) / 1000.0  # 60 FPS
 
             # Handle events
             for event in pygame.event.get():
+                needs_redraw = True  # Hover, clicks, window exposure, ...
                 if event.type == pygame.QUIT:
                     running = False
 
@@ -821,20 +883,21 @@ class EvacuationVisualizer:
                 if ticks_since_update >= 1.0:
                     self._do_simulation_step(sim, model)
                     ticks_since_update = 0
+                    needs_redraw = True
+
+            if not needs_redraw:
+                continue
+            needs_redraw = False
 
             # Render
             self.screen.fill(COLORS['background'])
 
             # Draw edges (filter by floor if selected)
-            for edge_id in sim.edges.keys():
-                edge = sim.edges[edge_id]
-                vertex_a = sim.vertices.get(edge.vertex_a)
-                vertex_b = sim.vertices.get(edge.vertex_b)
-
+            for edge_id in sim.edges:
                 # Skip edge if floor filter active and edge vertices don't match
-                if self.current_floor is not None and vertex_a and vertex_b:
-                    vertex_a_floor = getattr(vertex_a, 'floor', 1)
-                    vertex_b_floor = getattr(vertex_b, 'floor', 1)
+                floors = edge_floors.get(edge_id)
+                if self.current_floor is not None and floors:
+                    vertex_a_floor, vertex_b_floor = floors
                     # Only draw if both endpoints are on the current floor
                     if vertex_a_floor != self.current_floor or vertex_b_floor != self.current_floor:
                         continue
@@ -843,14 +906,9 @@ class EvacuationVisualizer:
 
             # Draw vertices (with fog of war in manual mode)
             # Collect all visited vertices by any firefighter
-            all_visited = set()
-            if self.manual_mode:
-                for ff in sim.firefighters.values():
-                    all_visited.update(ff.visited_vertices)
-
-            for vertex_id in sim.vertices.keys():
-                vertex = sim.vertices[vertex_id]
+            all_visited = self._get_all_visited(sim) if self.manual_mode else set()
 
+            for vertex_id, vertex in sim.vertices.items():
                 # Skip vertex if floor filter active and doesn't match
                 if self.current_floor is not None:
                     vertex_floor = getattr(vertex, 'floor', 1)
@@ -864,9 +922,7 @@ class EvacuationVisualizer:
                 )
 
             # Draw firefighters (filter by floor if selected)
-            for ff_id in sim.firefighters.keys():
-                ff = sim.firefighters[ff_id]
-
+            for ff_id, ff in sim.firefighters.items():
                 # Skip firefighter if floor filter active and doesn't match
                 if self.current_floor is not None:
                     ff_vertex = sim.vertices.get(ff.position)
@@ -896,6 +952,24 @@ class EvacuationVisualizer:
 
         pygame.quit()
 
+    def _get_all_visited(self, sim: Simulation) -> set:
+        """
+        Vertices visited by any firefighter, re-unioned only on change.
+
+        Visited sets only grow until replaced (clear_visited), so each set's
+        identity and size identify its contents between frames.
+        """
+        key = tuple(
+            (id(ff.visited_vertices), len(ff.visited_vertices))
+            for ff in sim.firefighters.values()
+        )
+        if key != self._all_visited_key:
+            self._all_visited = set().union(
+                *(ff.visited_vertices for ff in sim.firefighters.values())
+            )
+            self._all_visited_key = key
+        return self._all_visited
+
     def _do_simulation_step(self, sim: Simulation, model=None):
         """Execute one simulation step"""
         if model:
@@ -1003,8 +1077,7 @@ class EvacuationVisualizer:
 
 def visualize_layout(config_file: str):
     """Visualize just the building layout (static)"""
-    with open(config_file, 'r') as f:
-        config = json.load(f)
+    config = load_config(config_file)
 
     sim = Simulation(
         config=config,
@@ -1019,8 +1092,7 @@ def visualize_layout(config_file: str):
 
 def visualize_manual(config_file: str):
     """Run visualizer in manual control mode"""
-    with open(config_file, 'r') as f:
-        config = json.load(f)
+    config = load_config(config_file)
 
     sim = Simulation(
         config=config,
@@ -1047,8 +1119,7 @@ def visualize_manual(config_file: str):
 
 def visualize_auto(config_file: str, model=None):
     """Run visualizer with AI model (auto mode)"""
-    with open(config_file, 'r') as f:
-        config = json.load(f)
+    config = load_config(config_file)
 
     sim = Simulation(
         config=config,